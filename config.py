@@ -1,8 +1,25 @@
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
-# Default configuration
-DEFAULT_CONFIG: Dict[str, Any] = {
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap nested dicts in read-only mapping proxies"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively copy read-only mappings back into plain dicts"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+# Default configuration (read-only; use get_config() for the resolved view)
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze({
     "agents": {
         "data_analyst": {
             "model": "claude-sonnet-4-20250514",
@@ -47,27 +64,47 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "max_file_size_mb": 50,
         "timeout_seconds": 300,
         "enable_caching": True,
-        "parallel_processing": False
+        "parallel_processing": False,
+        "parallel_limit": 4
     }
-}
+})
 
-def get_config() -> Dict[str, Any]:
+
+@lru_cache(maxsize=None)
+def _resolve_config(
+    data_analysis_model: Optional[str],
+    risk_evaluation_model: Optional[str],
+    strategy_model: Optional[str]
+) -> Mapping[str, Any]:
+    """Build the read-only configuration for one set of model overrides"""
+    config: Dict[str, Any] = _thaw(DEFAULT_CONFIG)
+    
+    if data_analysis_model:
+        config["agents"]["data_analyst"]["model"] = data_analysis_model
+    
+    if risk_evaluation_model:
+        config["agents"]["risk_evaluator"]["model"] = risk_evaluation_model
+    
+    if strategy_model:
+        config["agents"]["strategy_advisor"]["model"] = strategy_model
+    
+    return _freeze(config)
+
+
+def get_config() -> Mapping[str, Any]:
     """
     Get configuration from environment or defaults
     
+    The resolved configuration is cached per combination of environment
+    overrides and returned as a read-only mapping, so repeated calls do
+    not allocate and callers cannot corrupt the shared defaults.
+    
     Returns:
-        Configuration dictionary
+        Read-only configuration mapping
     """
-    config = DEFAULT_CONFIG.copy()
-    
     # Override with environment variables if present
-    if os.getenv("DATA_ANALYSIS_MODEL"):
-        config["agents"]["data_analyst"]["model"] = os.getenv("DATA_ANALYSIS_MODEL")
-    
-    if os.getenv("RISK_EVALUATION_MODEL"):
-        config["agents"]["risk_evaluator"]["model"] = os.getenv("RISK_EVALUATION_MODEL")
-    
-    if os.getenv("STRATEGY_MODEL"):
-        config["agents"]["strategy_advisor"]["model"] = os.getenv("STRATEGY_MODEL")
-    
-    return config
+    return _resolve_config(
+        os.getenv("DATA_ANALYSIS_MODEL"),
+        os.getenv("RISK_EVALUATION_MODEL"),
+        os.getenv("STRATEGY_MODEL")
+    )
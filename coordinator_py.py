@@ -2,57 +2,239 @@
 Agno Multi-Agent Coordinator
 Orchestrates collaboration between financial analysis agents
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import asyncio
+import json
+import logging
 from datetime import datetime
+from functools import lru_cache
+from string import Template
+import numpy as np
+import pandas as pd
 from agno import Agent, Runner, AgentMessage
 
+from config import get_config
 from agents.data_analysis_agent import DataAnalysisAgent
 from agents.risk_evaluation_agent import RiskEvaluationAgent
 from agents.market_strategy_agent import MarketStrategyAgent
 from utils.report_generator import ReportGenerator
 
+logger = logging.getLogger(__name__)
 
-class FinancialAnalysisCoordinator:
+# Maps agent keys in self.agents to their keys in self.analysis_results
+_AGENT_RESULT_KEYS = {
+    'data_analyst': 'data_analysis',
+    'risk_evaluator': 'risk_evaluation',
+    'strategy_advisor': 'market_strategy'
+}
+
+# Priority assigned to recommendations contributed by each analysis stage
+_RECOMMENDATION_PRIORITY = {
+    'data_analysis': 'Medium',
+    'risk_evaluation': 'High',
+    'market_strategy': 'Medium'
+}
+
+# Minimum bid confidence for an agent to be awarded its stage
+_MIN_BID_CONFIDENCE = 0.5
+
+# Number of DataFrame rows included in prompt previews
+_PREVIEW_ROWS = 10
+
+# Stage prompt templates, parsed once at import
+_DATA_TMPL = Template("""Analyze the following financial data:
+            
+            Data Summary:
+            - Total records: $total_records
+            - Date range: $date_range
+            - Columns: $columns
+            
+            Calculate key financial metrics including:
+            1. Revenue trends and growth rates
+            2. Profitability metrics (margins, ROI)
+            3. Liquidity ratios
+            4. Statistical summaries
+            
+            Data: $preview
+            """)
+
+_RISK_TMPL = Template("""Evaluate financial risks based on:
+            
+            Data Analysis Results:
+            $data_analysis
+            
+            Assess:
+            1. Market volatility and exposure
+            2. Credit risk factors
+            3. Operational risks
+            4. Overall risk rating (Low/Medium/High)
+            
+            Provide specific risk mitigation recommendations.
+            """)
+
+_STRATEGY_TMPL = Template("""Develop strategic recommendations based on:
+            
+            Data Analysis: $data_analysis
+            Risk Assessment: $risk_analysis
+            
+            Provide:
+            1. Market positioning strategy
+            2. Investment recommendations
+            3. Growth opportunities
+            4. Action items with priorities
+            """)
+
+
+def _performance_trend(results: "AnalysisResults") -> Optional[str]:
+    """Trend reported by the data analysis, if it produced metrics"""
+    metrics = results.get('data_analysis', {}).get('metrics')
+    return metrics.get('trend', 'stable') if metrics else None
+
+
+def _overall_risk(results: "AnalysisResults") -> str:
+    """Overall risk level reported by the risk evaluation"""
+    return results.get('risk_evaluation', {}).get('overall_risk', 'Medium')
+
+
+def _opportunity_count(results: "AnalysisResults") -> Optional[int]:
+    """Number of strategic opportunities, if any were identified"""
+    return len(results.get('market_strategy', {}).get('opportunities', ())) or None
+
+
+# Findings as (getter, formatter) pairs, in report order; a getter returning
+# None skips its finding
+_FINDING_RULES = (
+    (_performance_trend, "Financial performance shows {} trend".format),
+    (_overall_risk, "Overall risk level assessed as: {}".format),
+    (_opportunity_count, "Identified {} strategic opportunities".format)
+)
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy and datetime values that json cannot encode natively"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _short_summary(obj: Any, limit: int = 1000) -> str:
     """
-    Coordinates multiple specialized agents using Agno framework
-    for comprehensive financial analysis
+    Serialize an object to compact JSON for prompts, capped at limit characters
+    
+    Encoding is incremental and stops as soon as the limit is reached, so
+    large payloads are never stringified in full. DataFrames are reduced
+    to their first rows before encoding.
     """
+    if isinstance(obj, pd.DataFrame):
+        obj = obj.head(_PREVIEW_ROWS).to_dict(orient='list')
     
-    def __init__(self, api_key: str = None):
-        """Initialize coordinator with specialized agents"""
-        self.api_key = api_key
-        self.agents = {}
-        self.analysis_results = {}
-        self.runner = None
-        self._initialize_agents()
+    encoder = json.JSONEncoder(
+        skipkeys=True, default=_json_default, separators=(',', ':')
+    )
+    chunks = []
+    size = 0
+    for chunk in encoder.iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
     
-    def _initialize_agents(self):
-        """Create and configure specialized financial agents"""
+    return ''.join(chunks)[:limit]
+
+
+@lru_cache(maxsize=None)
+def _shared_team(api_key: Optional[str]) -> Tuple[Dict[str, Agent], Runner]:
+    """
+    Create the specialized financial agents and their Agno runner
+    
+    The team is built once per API key and shared by every coordinator,
+    so repeated coordinator runs reuse the runner and its connections
+    instead of paying client setup and handshakes again.
+    """
+    agents = {
         # Data Analysis Agent
-        self.agents['data_analyst'] = DataAnalysisAgent(
+        'data_analyst': DataAnalysisAgent(
             name="DataAnalyst",
             description="Specializes in processing financial data and calculating key metrics"
-        )
+        ),
         
         # Risk Evaluation Agent
-        self.agents['risk_evaluator'] = RiskEvaluationAgent(
+        'risk_evaluator': RiskEvaluationAgent(
             name="RiskEvaluator",
             description="Evaluates financial risks and provides risk assessments"
-        )
+        ),
         
         # Market Strategy Agent
-        self.agents['strategy_advisor'] = MarketStrategyAgent(
+        'strategy_advisor': MarketStrategyAgent(
             name="StrategyAdvisor",
             description="Provides market insights and strategic recommendations"
         )
-        
-        # Initialize Agno Runner for agent coordination
-        self.runner = Runner(
-            agents=list(self.agents.values()),
-            api_key=self.api_key
+    }
+    
+    # Initialize Agno Runner for agent coordination
+    runner = Runner(agents=list(agents.values()), api_key=api_key)
+    return agents, runner
+
+
+class AnalysisResults:
+    """
+    Fixed-layout container for the results of one coordinator run
+    
+    Each stage fills its own slot; unset stages stay None.
+    """
+    
+    __slots__ = ('data_analysis', 'risk_evaluation', 'market_strategy', 'consensus')
+    
+    def __init__(self):
+        self.data_analysis = None
+        self.risk_evaluation = None
+        self.market_strategy = None
+        self.consensus = None
+    
+    def get(self, stage: str, default: Any = None) -> Any:
+        """Return a stage result, or default when it has not run"""
+        result = getattr(self, stage, None)
+        return default if result is None else result
+    
+    def completed(self) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+        """Return (stage, result) pairs for the stages that have run"""
+        return tuple(
+            (stage, getattr(self, stage))
+            for stage in self.__slots__
+            if getattr(self, stage) is not None
         )
     
+    def as_dict(self) -> Dict[str, Any]:
+        """Return completed stages as a plain dict for reporting"""
+        return dict(self.completed())
+
+
+class FinancialAnalysisCoordinator:
+    """
+    Coordinates multiple specialized agents using Agno framework
+    for comprehensive financial analysis
+    """
+    
+    def __init__(self, api_key: str = None):
+        """Initialize coordinator with specialized agents"""
+        self.api_key = api_key
+        self.config = get_config()
+        self.agents = {}
+        self.analysis_results = AnalysisResults()
+        self.runner = None
+        self._data_summary = None
+        self._run_timestamp = None
+        self._initialize_agents()
+    
+    def _initialize_agents(self):
+        """Attach the shared specialized agents and Agno runner"""
+        agents, self.runner = _shared_team(self.api_key)
+        self.agents.update(agents)
+    
     async def process_financial_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Coordinate agents to analyze financial data
@@ -63,34 +245,77 @@ class FinancialAnalysisCoordinator:
         Returns:
             Comprehensive analysis results from all agents
         """
-        print("\n🚀 Starting Multi-Agent Financial Analysis...")
-        print(f"⏰ Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"📊 Data sources: {len(data.get('sources', []))} files\n")
+        started = datetime.now()
+        logger.info(
+            "🚀 Starting Multi-Agent Financial Analysis (%s, %d data sources)",
+            started.strftime('%Y-%m-%d %H:%M:%S'),
+            len(data.get('sources', []))
+        )
+        
+        # One timestamp stamps every result produced during this run
+        self._run_timestamp = started.isoformat()
+        
+        # Summarize the input once for every prompt built during this run
+        self._data_summary = self._summarize_data(data)
+        
+        # Stages form a dependency chain (risk needs the data analysis,
+        # strategy needs both), so each stage awaits its inputs; every stage
+        # is bounded by the configured timeout.
         
         # Stage 1: Data Analysis Agent processes raw data
-        print("📈 Stage 1: Data Analysis Agent processing...")
-        data_analysis = await self._run_data_analysis(data)
-        self.analysis_results['data_analysis'] = data_analysis
+        logger.info("📈 Stage 1: Data Analysis Agent processing...")
+        data_analysis = await self._run_stage(self._run_data_analysis(data))
+        self.analysis_results.data_analysis = data_analysis
         
         # Stage 2: Risk Evaluation Agent assesses risks
-        print("🛡️  Stage 2: Risk Evaluation Agent assessing...")
-        risk_analysis = await self._run_risk_evaluation(data, data_analysis)
-        self.analysis_results['risk_evaluation'] = risk_analysis
-        
-        # Stage 3: Market Strategy Agent provides recommendations
-        print("💡 Stage 3: Market Strategy Agent strategizing...")
-        strategy_analysis = await self._run_strategy_analysis(
-            data, data_analysis, risk_analysis
+        logger.info("🛡️  Stage 2: Risk Evaluation Agent assessing...")
+        risk_analysis = await self._run_stage(
+            self._run_risk_evaluation(data, data_analysis)
         )
-        self.analysis_results['market_strategy'] = strategy_analysis
+        self.analysis_results.risk_evaluation = risk_analysis
+        
+        # Stage 3: Market Strategy Agent provides recommendations, if the
+        # data analysis gives it anything to work with
+        if await self._awards_stage('strategy_advisor', data_analysis):
+            logger.info("💡 Stage 3: Market Strategy Agent strategizing...")
+            strategy_analysis = await self._run_stage(
+                self._run_strategy_analysis(data, data_analysis, risk_analysis)
+            )
+            self.analysis_results.market_strategy = strategy_analysis
+        else:
+            logger.info("💡 Stage 3: Market Strategy Agent skipped (no strategic metrics)")
         
         # Stage 4: Inter-agent collaboration and consensus
-        print("🤝 Stage 4: Agent collaboration and consensus building...")
+        logger.info("🤝 Stage 4: Agent collaboration and consensus building...")
         consensus = await self._build_consensus()
-        self.analysis_results['consensus'] = consensus
+        self.analysis_results.consensus = consensus
+        
+        logger.info("✅ Multi-Agent Analysis Complete!")
+        return self.analysis_results.as_dict()
+    
+    async def _run_stage(self, coro):
+        """Await an agent stage, bounded by the configured system timeout"""
+        return await asyncio.wait_for(
+            coro, timeout=self.config['system']['timeout_seconds']
+        )
+    
+    async def _awards_stage(self, agent_name: str, task: Dict[str, Any]) -> bool:
+        """Ask an agent to bid for its stage; agents that cannot bid always win"""
+        bid = getattr(self.agents[agent_name], 'bid', None)
+        if bid is None:
+            return True
         
-        print("✅ Multi-Agent Analysis Complete!\n")
-        return self.analysis_results
+        offer = await bid(task)
+        return offer.get("confidence", 0.0) >= _MIN_BID_CONFIDENCE
+    
+    def _summarize_data(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """Build the data summary fields shared by the stage prompts"""
+        return {
+            "total_records": str(data.get('total_records', 0)),
+            "date_range": str(data.get('date_range', 'N/A')),
+            "columns": ', '.join(map(str, data.get('columns', []))),
+            "preview": _short_summary(data.get('parsed_data', {}), 1000)
+        }
     
     async def _run_data_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute data analysis agent"""
@@ -98,26 +323,14 @@ class FinancialAnalysisCoordinator:
         
         # Create message for the agent
         message = AgentMessage(
-            content=f"""Analyze the following financial data:
-            
-            Data Summary:
-            - Total records: {data.get('total_records', 0)}
-            - Date range: {data.get('date_range', 'N/A')}
-            - Columns: {', '.join(data.get('columns', []))}
-            
-            Calculate key financial metrics including:
-            1. Revenue trends and growth rates
-            2. Profitability metrics (margins, ROI)
-            3. Liquidity ratios
-            4. Statistical summaries
-            
-            Data: {str(data.get('parsed_data', {}))[:1000]}
-            """,
+            content=_DATA_TMPL.substitute(
+                self._data_summary or self._summarize_data(data)
+            ),
             metadata={"stage": "data_analysis", "priority": "high"}
         )
         
         # Run agent through Agno framework
-        result = await agent.analyze(data)
+        result = await agent.analyze(data, run_timestamp=self._run_timestamp)
         return result
     
     async def _run_risk_evaluation(
@@ -129,23 +342,15 @@ class FinancialAnalysisCoordinator:
         agent = self.agents['risk_evaluator']
         
         message = AgentMessage(
-            content=f"""Evaluate financial risks based on:
-            
-            Data Analysis Results:
-            {str(data_analysis)[:500]}
-            
-            Assess:
-            1. Market volatility and exposure
-            2. Credit risk factors
-            3. Operational risks
-            4. Overall risk rating (Low/Medium/High)
-            
-            Provide specific risk mitigation recommendations.
-            """,
+            content=_RISK_TMPL.substitute(
+                data_analysis=_short_summary(data_analysis, 500)
+            ),
             metadata={"stage": "risk_evaluation", "depends_on": "data_analysis"}
         )
         
-        result = await agent.evaluate(data, data_analysis)
+        result = await agent.evaluate(
+            data, data_analysis, run_timestamp=self._run_timestamp
+        )
         return result
     
     async def _run_strategy_analysis(
@@ -158,24 +363,19 @@ class FinancialAnalysisCoordinator:
         agent = self.agents['strategy_advisor']
         
         message = AgentMessage(
-            content=f"""Develop strategic recommendations based on:
-            
-            Data Analysis: {str(data_analysis)[:300]}
-            Risk Assessment: {str(risk_analysis)[:300]}
-            
-            Provide:
-            1. Market positioning strategy
-            2. Investment recommendations
-            3. Growth opportunities
-            4. Action items with priorities
-            """,
+            content=_STRATEGY_TMPL.substitute(
+                data_analysis=_short_summary(data_analysis, 300),
+                risk_analysis=_short_summary(risk_analysis, 300)
+            ),
             metadata={
                 "stage": "strategy", 
                 "depends_on": ["data_analysis", "risk_evaluation"]
             }
         )
         
-        result = await agent.strategize(data, data_analysis, risk_analysis)
+        result = await agent.strategize(
+            data, data_analysis, risk_analysis, run_timestamp=self._run_timestamp
+        )
         return result
     
     async def _build_consensus(self) -> Dict[str, Any]:
@@ -184,20 +384,21 @@ class FinancialAnalysisCoordinator:
         on key findings and recommendations
         """
         consensus = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._run_timestamp or datetime.now().isoformat(),
             "agent_contributions": {},
             "key_findings": [],
             "unified_recommendations": [],
             "confidence_level": "High"
         }
         
-        # Gather key points from each agent
-        for agent_name, agent in self.agents.items():
-            result = self.analysis_results.get(agent_name.replace('_', '_'), {})
-            consensus["agent_contributions"][agent_name] = {
-                "key_points": result.get("key_points", []),
-                "confidence": result.get("confidence", "Medium")
-            }
+        # Gather key points from all agents concurrently
+        semaphore = asyncio.Semaphore(self.config['system']['parallel_limit'])
+        names = list(self.agents)
+        contributions = await asyncio.gather(*(
+            self._gather_contribution(name, self.agents[name], semaphore)
+            for name in names
+        ))
+        consensus["agent_contributions"] = dict(zip(names, contributions))
         
         # Synthesize unified findings
         consensus["key_findings"] = self._synthesize_findings()
@@ -205,43 +406,43 @@ class FinancialAnalysisCoordinator:
         
         return consensus
     
+    async def _gather_contribution(
+        self, 
+        agent_name: str, 
+        agent: Agent, 
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Collect one agent's key points, using its async summarize hook if any"""
+        result = self.analysis_results.get(_AGENT_RESULT_KEYS.get(agent_name, agent_name), {})
+        
+        summarize = getattr(agent, 'summarize', None)
+        if callable(summarize):
+            async with semaphore:
+                result = await summarize(result)
+        
+        return {
+            "key_points": result.get("key_points", []),
+            "confidence": result.get("confidence", "Medium")
+        }
+    
     def _synthesize_findings(self) -> List[str]:
         """Synthesize key findings from all agents"""
         findings = []
-        
-        # Extract from data analysis
-        data_metrics = self.analysis_results.get('data_analysis', {}).get('metrics', {})
-        if data_metrics:
-            findings.append(
-                f"Financial performance shows {data_metrics.get('trend', 'stable')} trend"
-            )
-        
-        # Extract from risk evaluation
-        risk_level = self.analysis_results.get('risk_evaluation', {}).get('overall_risk', 'Medium')
-        findings.append(f"Overall risk level assessed as: {risk_level}")
-        
-        # Extract from strategy
-        opportunities = self.analysis_results.get('market_strategy', {}).get('opportunities', [])
-        if opportunities:
-            findings.append(f"Identified {len(opportunities)} strategic opportunities")
+        for getter, formatter in _FINDING_RULES:
+            value = getter(self.analysis_results)
+            if value is not None:
+                findings.append(formatter(value))
         
         return findings
     
     def _synthesize_recommendations(self) -> List[Dict[str, str]]:
         """Synthesize recommendations from all agents"""
-        recommendations = []
-        
         # Combine recommendations from all agents
-        for agent_name in ['data_analysis', 'risk_evaluation', 'market_strategy']:
-            agent_recs = self.analysis_results.get(agent_name, {}).get('recommendations', [])
-            for rec in agent_recs:
-                recommendations.append({
-                    "source": agent_name,
-                    "recommendation": rec,
-                    "priority": "High" if agent_name == 'risk_evaluation' else "Medium"
-                })
-        
-        return recommendations
+        return [
+            {"source": source, "recommendation": rec, "priority": priority}
+            for source, priority in _RECOMMENDATION_PRIORITY.items()
+            for rec in self.analysis_results.get(source, {}).get('recommendations', ())
+        ]
     
     def generate_report(self, output_path: str = "financial_report.pdf"):
         """
@@ -250,32 +451,34 @@ class FinancialAnalysisCoordinator:
         Args:
             output_path: Path for output PDF file
         """
-        print(f"\n📄 Generating comprehensive financial report...")
+        logger.info("📄 Generating comprehensive financial report...")
         
         report_generator = ReportGenerator()
         report_path = report_generator.generate(
-            analysis_results=self.analysis_results,
+            analysis_results=self.analysis_results.as_dict(),
             output_path=output_path
         )
         
-        print(f"✅ Report generated: {report_path}\n")
+        logger.info("✅ Report generated: %s", report_path)
         return report_path
     
     def get_agent_summary(self) -> Dict[str, Any]:
         """Get summary of all agent activities"""
+        completed = self.analysis_results.completed()
         return {
             "total_agents": len(self.agents),
             "agents": list(self.agents.keys()),
-            "analysis_complete": len(self.analysis_results) > 0,
-            "results_summary": {
-                agent: len(str(result)) 
-                for agent, result in self.analysis_results.items()
-            }
+            "analysis_complete": len(completed) > 0,
+            "results_summary": tuple(
+                (stage, len(str(result))) for stage, result in completed
+            )
         }
 
 
 async def main():
     """Example usage of the coordinator"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Sample data
     sample_data = {
         "sources": ["data.csv"],
@@ -293,7 +496,7 @@ async def main():
     coordinator.generate_report()
     
     # Print summary
-    print("Agent Summary:", coordinator.get_agent_summary())
+    logger.info("Agent Summary: %s", coordinator.get_agent_summary())
 
 
 if __name__ == "__main__":
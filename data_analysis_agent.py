@@ -1,11 +1,63 @@
 """
 Data Analysis Agent - Specializes in financial data processing and metric calculation
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+import copy
+import hashlib
+import logging
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from agno import Agent
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Columns of the common financial schema, reduced together by _calculate_metrics
+_FINANCIAL_COLUMNS = ('revenue', 'expenses', 'profit', 'investment')
+
+# Descriptive statistics reported per numeric column
+_STAT_FIELDS = ('mean', 'median', 'std_dev', 'min', 'max', 'variance')
+
+# Number of distinct inputs whose analysis results are kept per agent
+_CACHE_SIZE = 128
+
+
+def _column_stats(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute per-column descriptive statistics over a 2-D float matrix
+    
+    Each reduction runs once over the whole numeric block (axis=0) instead
+    of once per column. NaN values are skipped, matching pandas semantics.
+    Column sums are included so financial totals reuse the same pass.
+    
+    Args:
+        matrix: Numeric data with one column per metric
+        
+    Returns:
+        Mapping of statistic name to an array with one value per column
+    """
+    if matrix.shape[0] == 0:
+        empty = np.full(matrix.shape[1], np.nan)
+        stats = {name: empty for name in _STAT_FIELDS}
+        stats['sum'] = np.zeros(matrix.shape[1])
+        return stats
+    
+    with warnings.catch_warnings():
+        # All-NaN or single-row columns yield NaN, as pandas does
+        warnings.simplefilter('ignore', RuntimeWarning)
+        variance = np.nanvar(matrix, axis=0, ddof=1)
+        return {
+            'sum': np.nansum(matrix, axis=0),
+            'mean': np.nanmean(matrix, axis=0),
+            'median': np.nanmedian(matrix, axis=0),
+            'std_dev': np.sqrt(variance),
+            'min': np.nanmin(matrix, axis=0),
+            'max': np.nanmax(matrix, axis=0),
+            'variance': variance
+        }
 
 
 class DataAnalysisAgent(Agent):
@@ -22,22 +74,29 @@ class DataAnalysisAgent(Agent):
             "trend_detection",
             "data_validation"
         ]
+        self._cache_enabled = get_config()['system']['enable_caching']
+        self._cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
     
-    async def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze(
+        self, 
+        data: Dict[str, Any], 
+        run_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Perform comprehensive financial data analysis
         
         Args:
             data: Parsed financial data
+            run_timestamp: Timestamp of the coordinator run (defaults to now)
             
         Returns:
             Analysis results with metrics and insights
         """
-        print(f"  [{self.name}] Starting data analysis...")
+        logger.debug("[%s] Starting data analysis...", self.name)
         
         analysis_result = {
             "agent": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": run_timestamp or datetime.now().isoformat(),
             "metrics": {},
             "insights": [],
             "recommendations": [],
@@ -46,86 +105,152 @@ class DataAnalysisAgent(Agent):
         }
         
         try:
-            # Convert to DataFrame if dict
-            df = self._prepare_dataframe(data)
+            # Convert input to named column arrays
+            arrays = self._prepare_arrays(data)
+            
+            # Select the numeric block once for all numeric stages
+            columns, matrix = self._numeric_block(arrays)
+            
+            # Identical numeric input yields identical results
+            key = self._cache_key(arrays, columns, matrix)
+            if key is not None and key in self._cache:
+                self._cache.move_to_end(key)
+                cached = copy.deepcopy(self._cache[key])
+                cached["timestamp"] = analysis_result["timestamp"]
+                logger.debug("[%s] ✓ Analysis served from cache", self.name)
+                return cached
+            
+            # Reduce every numeric column once for metrics and statistics
+            column_stats = _column_stats(matrix)
             
             # Calculate financial metrics
-            analysis_result["metrics"] = self._calculate_metrics(df)
+            analysis_result["metrics"] = self._calculate_metrics(
+                columns, matrix, column_stats
+            )
             
             # Perform statistical analysis
-            analysis_result["statistics"] = self._statistical_analysis(df)
+            analysis_result["statistics"] = self._statistical_analysis(
+                columns, column_stats
+            )
             
             # Detect trends
-            analysis_result["trends"] = self._detect_trends(df)
-            
-            # Generate insights
-            analysis_result["insights"] = self._generate_insights(analysis_result)
+            analysis_result["trends"] = self._detect_trends(columns, matrix)
             
-            # Generate recommendations
-            analysis_result["recommendations"] = self._generate_recommendations(
-                analysis_result
-            )
+            # Generate insights, recommendations and key points
+            (
+                analysis_result["insights"],
+                analysis_result["recommendations"],
+                analysis_result["key_points"]
+            ) = self._derive_findings(analysis_result)
             
-            # Extract key points
-            analysis_result["key_points"] = self._extract_key_points(analysis_result)
+            if key is not None:
+                self._cache[key] = copy.deepcopy(analysis_result)
+                if len(self._cache) > _CACHE_SIZE:
+                    self._cache.popitem(last=False)
             
-            print(f"  [{self.name}] ✓ Analysis complete")
+            logger.debug("[%s] ✓ Analysis complete", self.name)
             
         except Exception as e:
-            print(f"  [{self.name}] ✗ Error: {str(e)}")
+            logger.error("[%s] ✗ Error: %s", self.name, e)
             analysis_result["error"] = str(e)
             analysis_result["confidence"] = "Low"
         
         return analysis_result
     
-    def _prepare_dataframe(self, data: Dict[str, Any]) -> pd.DataFrame:
-        """Convert input data to pandas DataFrame"""
-        if isinstance(data.get('parsed_data'), pd.DataFrame):
-            return data['parsed_data']
-        elif isinstance(data.get('parsed_data'), dict):
-            return pd.DataFrame(data['parsed_data'])
+    def _prepare_arrays(self, data: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Convert input data to a mapping of column name to ndarray"""
+        parsed = data.get('parsed_data')
+        if isinstance(parsed, pd.DataFrame):
+            numeric = set(parsed.select_dtypes(include=[np.number]).columns)
+            return {
+                column: parsed[column].to_numpy(
+                    dtype=np.float64 if column in numeric else None
+                )
+                for column in parsed.columns
+            }
+        elif isinstance(parsed, dict):
+            return self._arrays_from_dict(parsed)
         else:
-            # Create sample DataFrame for demonstration
-            return pd.DataFrame({
-                'revenue': [100000, 120000, 150000, 180000],
-                'expenses': [75000, 85000, 95000, 110000],
-                'profit': [25000, 35000, 55000, 70000]
-            })
+            # Create sample data for demonstration
+            return {
+                'revenue': np.array([100000, 120000, 150000, 180000], dtype=np.float64),
+                'expenses': np.array([75000, 85000, 95000, 110000], dtype=np.float64),
+                'profit': np.array([25000, 35000, 55000, 70000], dtype=np.float64)
+            }
     
-    def _calculate_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _arrays_from_dict(self, parsed: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Build column arrays from dict input with typed float64 columns
+        
+        Accepts column -> list, column -> {row: value} (DataFrame.to_dict())
+        and column -> scalar layouts. Numeric columns are converted to
+        float64 arrays up front so later numeric reads need no per-column
+        casts. Columns of unequal length are rejected.
+        """
+        columns = {}
+        for name, values in parsed.items():
+            if isinstance(values, dict):
+                values = list(values.values())
+            elif np.isscalar(values):
+                values = [values]
+            
+            try:
+                columns[name] = np.asarray(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                columns[name] = np.asarray(values, dtype=object)
+        
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError("All columns must be of the same length")
+        
+        return columns
+    
+    def _calculate_metrics(
+        self, 
+        columns: List[str], 
+        matrix: np.ndarray, 
+        column_stats: Dict[str, np.ndarray]
+    ) -> Dict[str, Any]:
         """Calculate key financial metrics"""
         metrics = {}
         
         try:
+            # Read the financial schema totals from the shared column reductions
+            index = {
+                column: columns.index(column)
+                for column in _FINANCIAL_COLUMNS if column in columns
+            }
+            totals = {column: column_stats['sum'][i] for column, i in index.items()}
+            averages = {column: column_stats['mean'][i] for column, i in index.items()}
+            
             # Revenue metrics
-            if 'revenue' in df.columns:
-                metrics['total_revenue'] = float(df['revenue'].sum())
-                metrics['average_revenue'] = float(df['revenue'].mean())
-                metrics['revenue_growth'] = self._calculate_growth_rate(df['revenue'])
+            if 'revenue' in totals:
+                metrics['total_revenue'] = float(totals['revenue'])
+                metrics['average_revenue'] = float(averages['revenue'])
+                metrics['revenue_growth'] = self._calculate_growth_rate(
+                    matrix[:, index['revenue']]
+                )
             
             # Profitability metrics
-            if 'profit' in df.columns:
-                metrics['total_profit'] = float(df['profit'].sum())
-                metrics['average_profit'] = float(df['profit'].mean())
-                if 'revenue' in df.columns:
+            if 'profit' in totals:
+                metrics['total_profit'] = float(totals['profit'])
+                metrics['average_profit'] = float(averages['profit'])
+                if 'revenue' in totals:
                     metrics['profit_margin'] = (
                         metrics['total_profit'] / metrics['total_revenue'] * 100
                     )
             
             # Expense metrics
-            if 'expenses' in df.columns:
-                metrics['total_expenses'] = float(df['expenses'].sum())
-                metrics['average_expenses'] = float(df['expenses'].mean())
-                if 'revenue' in df.columns:
+            if 'expenses' in totals:
+                metrics['total_expenses'] = float(totals['expenses'])
+                metrics['average_expenses'] = float(averages['expenses'])
+                if 'revenue' in totals:
                     metrics['expense_ratio'] = (
                         metrics['total_expenses'] / metrics['total_revenue'] * 100
                     )
             
             # Return on Investment (if applicable)
-            if 'investment' in df.columns and 'profit' in df.columns:
-                metrics['roi'] = (
-                    df['profit'].sum() / df['investment'].sum() * 100
-                )
+            if 'investment' in totals and 'profit' in totals:
+                metrics['roi'] = float(totals['profit'] / totals['investment'] * 100)
             
             metrics['trend'] = 'positive' if metrics.get('revenue_growth', 0) > 0 else 'negative'
             
@@ -134,63 +259,107 @@ class DataAnalysisAgent(Agent):
         
         return metrics
     
-    def _calculate_growth_rate(self, series: pd.Series) -> float:
+    def _calculate_growth_rate(self, values: np.ndarray) -> float:
         """Calculate growth rate for a time series"""
-        if len(series) < 2:
+        if values.size < 2 or values[0] == 0:
             return 0.0
         
-        first_value = series.iloc[0]
-        last_value = series.iloc[-1]
+        growth_rate = (values[-1] - values[0]) / values[0] * 100
+        return round(float(growth_rate), 2)
+    
+    def _numeric_block(
+        self, 
+        arrays: Dict[str, np.ndarray]
+    ) -> Tuple[List[str], np.ndarray]:
+        """Return numeric column names and their values as one float64 matrix"""
+        columns = [
+            column for column, values in arrays.items()
+            if np.issubdtype(values.dtype, np.number)
+        ]
+        rows = len(next(iter(arrays.values()))) if arrays else 0
+        matrix = np.empty((rows, len(columns)), dtype=np.float64)
+        for i, column in enumerate(columns):
+            matrix[:, i] = arrays[column]
+        return columns, matrix
+    
+    def _cache_key(
+        self, 
+        arrays: Dict[str, np.ndarray], 
+        columns: List[str], 
+        matrix: np.ndarray
+    ) -> Optional[bytes]:
+        """
+        Content hash of the numeric input, or None when caching does not apply
         
-        if first_value == 0:
-            return 0.0
+        Results depend only on the numeric block, so it is hashed together
+        with its column names.
+        """
+        if not self._cache_enabled:
+            return None
         
-        growth_rate = ((last_value - first_value) / first_value) * 100
-        return round(growth_rate, 2)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((columns, matrix.shape)).encode())
+        digest.update(np.ascontiguousarray(matrix).tobytes())
+        return digest.digest()
     
-    def _statistical_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _statistical_analysis(
+        self, 
+        columns: List[str], 
+        column_stats: Dict[str, np.ndarray]
+    ) -> Dict[str, Any]:
         """Perform statistical analysis on financial data"""
-        stats = {}
-        
-        for column in df.select_dtypes(include=[np.number]).columns:
-            stats[column] = {
-                'mean': float(df[column].mean()),
-                'median': float(df[column].median()),
-                'std_dev': float(df[column].std()),
-                'min': float(df[column].min()),
-                'max': float(df[column].max()),
-                'variance': float(df[column].var())
-            }
-        
-        return stats
+        return {
+            column: {name: float(column_stats[name][i]) for name in _STAT_FIELDS}
+            for i, column in enumerate(columns)
+        }
     
-    def _detect_trends(self, df: pd.DataFrame) -> Dict[str, str]:
+    def _detect_trends(self, columns: List[str], matrix: np.ndarray) -> Dict[str, str]:
         """Detect trends in financial data"""
-        trends = {}
+        if matrix.shape[0] < 3:
+            return {column: "Insufficient data" for column in columns}
+        
+        # Simple trend detection based on the last three values of every column
+        steps = np.diff(matrix[-3:], axis=0)
+        increasing = (steps >= 0).all(axis=0)
+        decreasing = (steps <= 0).all(axis=0)
         
-        for column in df.select_dtypes(include=[np.number]).columns:
-            if len(df[column]) >= 3:
-                # Simple trend detection based on recent values
-                recent_values = df[column].tail(3).values
-                if all(recent_values[i] <= recent_values[i+1] for i in range(len(recent_values)-1)):
-                    trends[column] = "Increasing"
-                elif all(recent_values[i] >= recent_values[i+1] for i in range(len(recent_values)-1)):
-                    trends[column] = "Decreasing"
-                else:
-                    trends[column] = "Fluctuating"
+        trends = {}
+        for i, column in enumerate(columns):
+            if increasing[i]:
+                trends[column] = "Increasing"
+            elif decreasing[i]:
+                trends[column] = "Decreasing"
             else:
-                trends[column] = "Insufficient data"
+                trends[column] = "Fluctuating"
         
         return trends
     
-    def _generate_insights(self, analysis: Dict[str, Any]) -> List[str]:
-        """Generate actionable insights from analysis"""
+    def _derive_findings(
+        self, 
+        analysis: Dict[str, Any]
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Derive insights, recommendations and key points in one pass
+        
+        Args:
+            analysis: Analysis results with metrics and trends
+            
+        Returns:
+            Tuple of (insights, recommendations, key_points)
+        """
         insights = []
+        recommendations = []
+        key_points = []
         metrics = analysis.get('metrics', {})
+        trends = analysis.get('trends', {})
+        growth = metrics.get('revenue_growth', 0)
+        margin = metrics.get('profit_margin', 0)
+        
+        # Revenue
+        if 'total_revenue' in metrics:
+            key_points.append(f"Total Revenue: ${metrics['total_revenue']:,.2f}")
         
-        # Revenue insights
         if 'revenue_growth' in metrics:
-            growth = metrics['revenue_growth']
             if growth > 10:
                 insights.append(
                     f"Strong revenue growth of {growth:.1f}% indicates healthy business expansion"
@@ -200,62 +369,37 @@ class DataAnalysisAgent(Agent):
                     f"Revenue declined by {abs(growth):.1f}%, requiring immediate attention"
                 )
         
-        # Profitability insights
+        if growth < 5:
+            recommendations.append(
+                "Focus on revenue growth strategies: market expansion, product diversification"
+            )
+        
+        # Profitability
         if 'profit_margin' in metrics:
-            margin = metrics['profit_margin']
             if margin > 20:
                 insights.append(f"Excellent profit margin of {margin:.1f}%")
             elif margin < 5:
                 insights.append(f"Low profit margin of {margin:.1f}% needs improvement")
+            key_points.append(f"Profit Margin: {margin:.2f}%")
         
-        # Expense insights
-        if 'expense_ratio' in metrics:
-            ratio = metrics['expense_ratio']
-            if ratio > 80:
-                insights.append(
-                    f"High expense ratio of {ratio:.1f}% - cost optimization recommended"
-                )
-        
-        return insights
-    
-    def _generate_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
-        """Generate recommendations based on analysis"""
-        recommendations = []
-        metrics = analysis.get('metrics', {})
-        trends = analysis.get('trends', {})
-        
-        # Revenue recommendations
-        if metrics.get('revenue_growth', 0) < 5:
+        if margin < 15:
             recommendations.append(
-                "Focus on revenue growth strategies: market expansion, product diversification"
+                "Improve profitability through cost optimization and pricing strategy review"
             )
         
-        # Profitability recommendations
-        if metrics.get('profit_margin', 0) < 15:
-            recommendations.append(
-                "Improve profitability through cost optimization and pricing strategy review"
+        # Growth headline follows profitability among the key points
+        if 'revenue_growth' in metrics:
+            key_points.append(f"Growth Rate: {growth:.2f}%")
+        
+        # Expenses
+        if 'expense_ratio' in metrics and metrics['expense_ratio'] > 80:
+            insights.append(
+                f"High expense ratio of {metrics['expense_ratio']:.1f}% - cost optimization recommended"
             )
         
-        # Trend-based recommendations
         if trends.get('expenses') == "Increasing":
             recommendations.append(
                 "Monitor and control rising expenses to maintain profitability"
             )
         
-        return recommendations
-    
-    def _extract_key_points(self, analysis: Dict[str, Any]) -> List[str]:
-        """Extract key points for inter-agent communication"""
-        key_points = []
-        metrics = analysis.get('metrics', {})
-        
-        if 'total_revenue' in metrics:
-            key_points.append(f"Total Revenue: ${metrics['total_revenue']:,.2f}")
-        
-        if 'profit_margin' in metrics:
-            key_points.append(f"Profit Margin: {metrics['profit_margin']:.2f}%")
-        
-        if 'revenue_growth' in metrics:
-            key_points.append(f"Growth Rate: {metrics['revenue_growth']:.2f}%")
-        
-        return key_points
\ No newline at end of file
+        return insights, recommendations, key_points
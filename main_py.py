@@ -3,13 +3,90 @@ Main Entry Point for Agno Multi-Agent Financial Analysis System
 """
 import asyncio
 import argparse
+import hashlib
+import logging
 import os
+import pickle
 import sys
+import tempfile
 from typing import List
 from dotenv import load_dotenv
 
-from coordinator import FinancialAnalysisCoordinator
-from parsers import ParserFactory
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Directory holding pickled parser results from previous runs
+_PARSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'agno_fa')
+
+# Bump whenever parser output changes, so older pickles stop matching
+_CACHE_VERSION = 2
+
+# Environment settings that change what the parsers return
+_PARSER_SETTINGS = ('PARSER_PRECISION', 'PARSER_PARALLEL_SHEETS')
+
+# Horizontal rule framing the CLI banner and summary
+_RULE = "=" * 60
+
+# Maximum number of input files parsed at the same time
+_PARSE_CONCURRENCY = 8
+
+# Loggers of this application's modules: INFO by default, DEBUG under
+# --verbose. Third-party loggers (httpx, pdfminer, ...) stay at WARNING.
+_APP_LOGGERS = ('__main__', 'coordinator', 'parsers', 'agents', 'utils', 'config')
+
+
+def _parse_cached(file_path: str) -> dict:
+    """
+    Parse a file, reusing the result of an earlier run while it is unchanged
+    
+    Results are pickled under _PARSE_CACHE_DIR, keyed by the file's absolute
+    path, modification time and size, _CACHE_VERSION and the parser
+    settings in the environment. Unreadable cache entries are ignored and
+    the file is parsed again.
+    """
+    from parsers import ParserFactory
+    
+    if not get_config()['system']['enable_caching']:
+        return ParserFactory.parse_file(file_path)
+    
+    stat = os.stat(file_path)
+    settings = ':'.join(
+        os.getenv(name, '').strip().lower() for name in _PARSER_SETTINGS
+    )
+    key = hashlib.blake2b(
+        f"{_CACHE_VERSION}:{os.path.abspath(file_path)}:{stat.st_mtime_ns}:"
+        f"{stat.st_size}:{settings}".encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_path = os.path.join(_PARSE_CACHE_DIR, f"{key}.pkl")
+    
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            parsed = pickle.load(cache_file)
+        logger.debug("Loaded %s from parse cache %s", file_path, cache_path)
+        return parsed
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable parse cache %s: %s", cache_path, e)
+    
+    parsed = ParserFactory.parse_file(file_path)
+    
+    try:
+        os.makedirs(_PARSE_CACHE_DIR, exist_ok=True)
+        fd, partial_path = tempfile.mkstemp(dir=_PARSE_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                pickle.dump(parsed, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_path, cache_path)
+        except BaseException:
+            os.unlink(partial_path)
+            raise
+    except Exception as e:
+        logger.debug("Could not cache parse result for %s: %s", file_path, e)
+    
+    return parsed
 
 
 class FinancialAnalysisApp:
@@ -28,7 +105,7 @@ class FinancialAnalysisApp:
         self.coordinator = None
         
         if not self.api_key:
-            print("⚠️  Warning: ANTHROPIC_API_KEY not found. Please set it in .env file")
+            logger.warning("⚠️  Warning: ANTHROPIC_API_KEY not found. Please set it in .env file")
     
     async def process_files(
         self, 
@@ -45,37 +122,39 @@ class FinancialAnalysisApp:
         Returns:
             Path to generated report
         """
-        print("\n" + "="*60)
-        print("  AGNO MULTI-AGENT FINANCIAL ANALYSIS SYSTEM")
-        print("="*60 + "\n")
+        logger.info(
+            "\n%s\n  AGNO MULTI-AGENT FINANCIAL ANALYSIS SYSTEM\n%s\n", _RULE, _RULE
+        )
         
         # Step 1: Parse input files
-        print("📂 Step 1: Parsing input files...")
+        logger.info("📂 Step 1: Parsing input files...")
         parsed_data = await self._parse_files(input_files)
         
         # Step 2: Initialize coordinator
-        print("\n🤖 Step 2: Initializing multi-agent system...")
+        logger.info("\n🤖 Step 2: Initializing multi-agent system...")
+        from coordinator import FinancialAnalysisCoordinator
+        
         self.coordinator = FinancialAnalysisCoordinator(api_key=self.api_key)
         
         # Step 3: Run analysis
-        print("\n🔍 Step 3: Running multi-agent analysis...")
+        logger.info("\n🔍 Step 3: Running multi-agent analysis...")
         results = await self.coordinator.process_financial_data(parsed_data)
         
         # Step 4: Generate report
-        print("\n📊 Step 4: Generating comprehensive report...")
+        logger.info("\n📊 Step 4: Generating comprehensive report...")
         if not output_path:
             output_path = "financial_analysis_report.pdf"
         
         report_path = self.coordinator.generate_report(output_path)
         
         # Summary
-        print("\n" + "="*60)
-        print("✅ ANALYSIS COMPLETE")
-        print("="*60)
-        print(f"\n📄 Report saved to: {report_path}")
-        print(f"📈 Total agents: {len(self.coordinator.agents)}")
-        print(f"✓  Analysis stages completed: 4")
-        print("\n" + "="*60 + "\n")
+        logger.info(
+            "\n%s\n✅ ANALYSIS COMPLETE\n%s\n\n"
+            "📄 Report saved to: %s\n"
+            "📈 Total agents: %d\n"
+            "✓  Analysis stages completed: 4\n\n%s\n",
+            _RULE, _RULE, report_path, len(self.coordinator.agents), _RULE
+        )
         
         return report_path
     
@@ -93,31 +172,46 @@ class FinancialAnalysisApp:
         sources = []
         
         for file_path in file_paths:
-            if not os.path.exists(file_path):
-                print(f"  ⚠️  File not found: {file_path}")
+            logger.info("  Processing: %s", os.path.basename(file_path))
+        
+        # Parse all files concurrently; results keep the input order. Missing
+        # files surface as FileNotFoundError from the parse itself.
+        semaphore = asyncio.Semaphore(_PARSE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._parse_file(semaphore, file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        
+        for file_path, parsed in zip(file_paths, results):
+            if isinstance(parsed, FileNotFoundError):
+                logger.warning("  ⚠️  File not found: %s", file_path)
+                continue
+            if isinstance(parsed, Exception):
+                logger.error("  ✗ Error parsing %s: %s", file_path, parsed)
                 continue
             
-            try:
-                print(f"  Processing: {os.path.basename(file_path)}")
-                
-                # Get appropriate parser and parse file
-                parsed = ParserFactory.parse_file(file_path)
-                all_data.append(parsed)
-                sources.append(file_path)
-                
-                if self.verbose:
-                    print(f"    ✓ Successfully parsed {os.path.basename(file_path)}")
-                    
-            except Exception as e:
-                print(f"  ✗ Error parsing {file_path}: {str(e)}")
+            all_data.append(parsed)
+            sources.append(file_path)
+            
+            logger.debug("    ✓ Successfully parsed %s", os.path.basename(file_path))
         
         # Combine all parsed data
         combined_data = self._combine_data(all_data, sources)
         
-        print(f"\n  ✓ Successfully parsed {len(sources)} file(s)")
+        logger.info("\n  ✓ Successfully parsed %d file(s)", len(sources))
         
         return combined_data
     
+    async def _parse_file(
+        self, 
+        semaphore: asyncio.Semaphore, 
+        file_path: str
+    ) -> dict:
+        """Parse one file in a worker thread, bounded by the semaphore"""
+        async with semaphore:
+            # Get appropriate parser and parse file
+            return await asyncio.to_thread(_parse_cached, file_path)
+    
     def _combine_data(self, parsed_data_list: List[dict], sources: List[str]) -> dict:
         """
         Combine data from multiple sources
@@ -137,28 +231,36 @@ class FinancialAnalysisApp:
             data['sources'] = sources
             return data
         
-        # Combine multiple sources
-        combined_df = pd.DataFrame()
+        # Combine multiple sources; counts and columns come from the frames
+        frames = [
+            data['parsed_data'] for data in parsed_data_list
+            if isinstance(data.get('parsed_data'), pd.DataFrame)
+        ]
+        total_records = sum(len(frame) for frame in frames)
+        columns = list(dict.fromkeys(
+            column for frame in frames for column in frame.columns
+        ))
+        metadata = {
+            'total_files': len(sources),
+            'file_types': [f.split('.')[-1] for f in sources]
+        }
         
-        for data in parsed_data_list:
-            if 'parsed_data' in data:
-                df = data['parsed_data']
-                if isinstance(df, pd.DataFrame):
-                    combined_df = pd.concat([combined_df, df], ignore_index=True)
+        if not total_records or not columns:
+            return {
+                'sources': sources,
+                'parsed_data': parsed_data_list[0].get('parsed_data', {}),
+                'total_records': 0,
+                'columns': [],
+                'metadata': metadata
+            }
         
-        # Create combined structure
-        combined = {
+        return {
             'sources': sources,
-            'parsed_data': combined_df if not combined_df.empty else parsed_data_list[0].get('parsed_data', {}),
-            'total_records': len(combined_df) if not combined_df.empty else 0,
-            'columns': list(combined_df.columns) if not combined_df.empty else [],
-            'metadata': {
-                'total_files': len(sources),
-                'file_types': [f.split('.')[-1] for f in sources]
-            }
+            'parsed_data': pd.concat(frames, ignore_index=True),
+            'total_records': total_records,
+            'columns': columns,
+            'metadata': metadata
         }
-        
-        return combined
 
 
 def setup_argument_parser():
@@ -224,6 +326,16 @@ async def main():
     parser = setup_argument_parser()
     args = parser.parse_args()
     
+    # Route CLI, agent and coordinator progress to stdout
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        stream=sys.stdout
+    )
+    app_level = logging.DEBUG if args.verbose else logging.INFO
+    for name in _APP_LOGGERS:
+        logging.getLogger(name).setLevel(app_level)
+    
     # Create application instance
     app = FinancialAnalysisApp(
         api_key=args.api_key,
@@ -240,14 +352,11 @@ async def main():
         return 0
         
     except KeyboardInterrupt:
-        print("\n\n⚠️  Process interrupted by user")
+        logger.warning("\n\n⚠️  Process interrupted by user")
         return 1
         
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
+        logger.error("\n❌ Error: %s", e, exc_info=args.verbose)
         return 1
 
 
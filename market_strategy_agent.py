@@ -1,11 +1,183 @@
 """
 Market Strategy Agent - Specializes in strategic planning and market insights
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from collections import defaultdict
+import logging
+import sys
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from agno import Agent
 
+logger = logging.getLogger(__name__)
+
+# Rating labels shared by priorities, severities, risk levels and positions
+HIGH, MEDIUM, LOW = sys.intern("High"), sys.intern("Medium"), sys.intern("Low")
+STRONG, WEAK = sys.intern("Strong"), sys.intern("Weak")
+
+_GROWTH_STRATEGY = sys.intern("Growth Strategy")
+
+class Opportunity(NamedTuple):
+    """Strategic opportunity identified for the business"""
+    type: str
+    description: str
+    priority: str
+    potential_impact: str
+
+
+class Threat(NamedTuple):
+    """Strategic threat with its suggested mitigation"""
+    type: str
+    description: str
+    severity: str
+    mitigation: str
+
+
+class Recommendation(NamedTuple):
+    """Prioritized strategic recommendation"""
+    category: str
+    recommendation: str
+    rationale: str
+    expected_outcome: str
+    priority: str
+
+
+# Position notes as (section, text), keyed by the outcome label they explain
+_GROWTH_NOTES = {
+    HIGH: ('competitive_advantage', "Strong revenue growth trajectory"),
+    LOW: ('areas_for_improvement', "Limited revenue growth")
+}
+_RISK_NOTES = {
+    LOW: ('competitive_advantage', "Low risk profile enables strategic flexibility"),
+    HIGH: ('areas_for_improvement', "High risk exposure limits strategic options")
+}
+_PROFITABILITY_NOTES = {
+    True: ('competitive_advantage', "Healthy profit margins"),
+    False: ('areas_for_improvement', "Profitability requires improvement")
+}
+
+# Opportunities as (predicate(metrics, risk_evaluation), entry), in report order
+_OPPORTUNITY_RULES = (
+    (
+        lambda metrics, risk: metrics.get('revenue_growth', 0) > 10,
+        Opportunity(
+            type="Market Expansion",
+            description="Strong growth trend indicates market opportunity for expansion",
+            priority=HIGH,
+            potential_impact="Significant revenue increase"
+        )
+    ),
+    (
+        lambda metrics, risk: metrics.get('expense_ratio', 0) > 70,
+        Opportunity(
+            type="Cost Optimization",
+            description="High expense ratio presents opportunity for efficiency gains",
+            priority=MEDIUM,
+            potential_impact="Improved profitability by 5-10%"
+        )
+    ),
+    (
+        lambda metrics, risk: risk.get('overall_risk') == LOW,
+        Opportunity(
+            type="Strategic Investment",
+            description="Low risk profile allows for strategic investments in growth",
+            priority=HIGH,
+            potential_impact="Long-term competitive advantage"
+        )
+    ),
+    (
+        lambda metrics, risk: True,
+        Opportunity(
+            type="Digital Innovation",
+            description="Leverage technology for operational excellence",
+            priority=MEDIUM,
+            potential_impact="15-20% efficiency improvement"
+        )
+    )
+)
+
+# Threats as (predicate(metrics, risk_factors), entry), in report order
+_THREAT_RULES = (
+    (
+        lambda metrics, factors: factors.get('market_risk', {}).get('level') in (HIGH, MEDIUM),
+        Threat(
+            type="Market Volatility",
+            description="High market volatility may impact revenue stability",
+            severity=HIGH,
+            mitigation="Diversify revenue streams"
+        )
+    ),
+    (
+        lambda metrics, factors: metrics.get('profit_margin', 0) < 10,
+        Threat(
+            type="Profitability Pressure",
+            description="Low margins vulnerable to cost increases",
+            severity=MEDIUM,
+            mitigation="Implement cost management and pricing optimization"
+        )
+    ),
+    (
+        lambda metrics, factors: factors.get('liquidity_risk', {}).get('level') == HIGH,
+        Threat(
+            type="Cash Flow Constraints",
+            description="Limited liquidity may restrict operational flexibility",
+            severity=HIGH,
+            mitigation="Improve working capital management"
+        )
+    ),
+    (
+        lambda metrics, factors: metrics.get('revenue_growth', 0) < 5,
+        Threat(
+            type="Competitive Pressure",
+            description="Slow growth may indicate market share loss",
+            severity=MEDIUM,
+            mitigation="Enhance competitive positioning and innovation"
+        )
+    )
+)
+
+
+def _bucket(items: List[NamedTuple], field: str) -> Dict[str, List[NamedTuple]]:
+    """Group records by the value of one field in a single pass, keeping order"""
+    buckets = defaultdict(list)
+    for item in items:
+        buckets[getattr(item, field)].append(item)
+    return buckets
+
+
+def _position_labels(profit_margin: Any, revenue_growth: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Label strategic strength and growth potential
+    
+    Works on scalars and on per-firm arrays alike, so a batch of firms is
+    classified in one vectorized pass.
+    
+    Args:
+        profit_margin: Profit margin(s) in percent
+        revenue_growth: Revenue growth rate(s) in percent
+        
+    Returns:
+        Tuple of (strength, growth_potential) label arrays
+    """
+    profit_margin = np.asarray(profit_margin)
+    revenue_growth = np.asarray(revenue_growth)
+    
+    strength = np.select(
+        [
+            (profit_margin > 20) & (revenue_growth > 15),
+            (profit_margin < 10) | (revenue_growth < 0)
+        ],
+        [STRONG, WEAK],
+        default=MEDIUM
+    )
+    growth_potential = np.select(
+        [revenue_growth > 10, revenue_growth < 5],
+        [HIGH, LOW],
+        default=MEDIUM
+    )
+    return strength, growth_potential
+
 
 class MarketStrategyAgent(Agent):
     """
@@ -22,11 +194,34 @@ class MarketStrategyAgent(Agent):
             "competitive_positioning"
         ]
     
+    async def bid(self, data_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Estimate how much this agent can contribute for the given analysis
+        
+        Strategy is driven by profitability and growth, so the bid is the
+        share of those metrics present in the data analysis. A bid of 0.0
+        means there is nothing to strategize on.
+        
+        Args:
+            data_analysis: Results from data analysis agent
+            
+        Returns:
+            Bid with the agent name and a confidence between 0.0 and 1.0
+        """
+        metrics = data_analysis.get('metrics', {})
+        drivers = ('profit_margin', 'revenue_growth')
+        
+        return {
+            "agent": self.name,
+            "confidence": sum(driver in metrics for driver in drivers) / len(drivers)
+        }
+    
     async def strategize(
         self,
         data: Dict[str, Any],
         data_analysis: Dict[str, Any],
-        risk_evaluation: Dict[str, Any]
+        risk_evaluation: Dict[str, Any],
+        run_timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Develop strategic recommendations based on data and risk analysis
@@ -35,21 +230,22 @@ class MarketStrategyAgent(Agent):
             data: Raw financial data
             data_analysis: Results from data analysis agent
             risk_evaluation: Results from risk evaluation agent
+            run_timestamp: Timestamp of the coordinator run (defaults to now)
             
         Returns:
             Strategic recommendations and action plan
         """
-        print(f"  [{self.name}] Developing strategic recommendations...")
+        logger.debug("[%s] Developing strategic recommendations...", self.name)
         
         strategy_result = {
             "agent": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": run_timestamp or datetime.now().isoformat(),
             "strategic_position": {},
             "opportunities": [],
             "threats": [],
             "recommendations": [],
             "action_plan": [],
-            "confidence": "High",
+            "confidence": HIGH,
             "key_points": []
         }
         
@@ -60,36 +256,37 @@ class MarketStrategyAgent(Agent):
             )
             
             # Identify opportunities
-            strategy_result["opportunities"] = self._identify_opportunities(
-                data_analysis, risk_evaluation
-            )
+            opportunities = self._identify_opportunities(data_analysis, risk_evaluation)
+            strategy_result["opportunities"] = [o._asdict() for o in opportunities]
             
             # Identify threats
-            strategy_result["threats"] = self._identify_threats(
-                data_analysis, risk_evaluation
-            )
+            threats = self._identify_threats(data_analysis, risk_evaluation)
+            strategy_result["threats"] = [t._asdict() for t in threats]
+            threats_by_severity = _bucket(threats, 'severity')
             
             # Generate strategic recommendations
-            strategy_result["recommendations"] = self._generate_strategic_recommendations(
-                strategy_result
+            recommendations = self._generate_strategic_recommendations(
+                strategy_result, threats_by_severity
             )
+            strategy_result["recommendations"] = [r._asdict() for r in recommendations]
+            recommendations_by_priority = _bucket(recommendations, 'priority')
             
             # Create action plan
             strategy_result["action_plan"] = self._create_action_plan(
-                strategy_result
+                recommendations_by_priority
             )
             
             # Extract key points
             strategy_result["key_points"] = self._extract_key_points(
-                strategy_result
+                strategy_result, threats_by_severity
             )
             
-            print(f"  [{self.name}] ✓ Strategy development complete")
+            logger.debug("[%s] ✓ Strategy development complete", self.name)
             
         except Exception as e:
-            print(f"  [{self.name}] ✗ Error: {str(e)}")
+            logger.error("[%s] ✗ Error: %s", self.name, e)
             strategy_result["error"] = str(e)
-            strategy_result["confidence"] = "Low"
+            strategy_result["confidence"] = LOW
         
         return strategy_result
     
@@ -99,56 +296,28 @@ class MarketStrategyAgent(Agent):
         risk_evaluation: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Analyze current strategic position"""
-        position = {
-            "strength": "Medium",
-            "growth_potential": "Medium",
-            "competitive_advantage": [],
-            "areas_for_improvement": []
-        }
-        
-        # Analyze financial strength
         metrics = data_analysis.get('metrics', {})
         profit_margin = metrics.get('profit_margin', 0)
         revenue_growth = metrics.get('revenue_growth', 0)
+        strength, growth_potential = _position_labels(profit_margin, revenue_growth)
         
-        # Determine strength
-        if profit_margin > 20 and revenue_growth > 15:
-            position["strength"] = "Strong"
-        elif profit_margin < 10 or revenue_growth < 0:
-            position["strength"] = "Weak"
-        
-        # Assess growth potential
-        if revenue_growth > 10:
-            position["growth_potential"] = "High"
-            position["competitive_advantage"].append(
-                "Strong revenue growth trajectory"
-            )
-        elif revenue_growth < 5:
-            position["growth_potential"] = "Low"
-            position["areas_for_improvement"].append(
-                "Limited revenue growth"
-            )
-        
-        # Consider risk factors
-        overall_risk = risk_evaluation.get('overall_risk', 'Medium')
-        if overall_risk == 'Low':
-            position["competitive_advantage"].append(
-                "Low risk profile enables strategic flexibility"
-            )
-        elif overall_risk == 'High':
-            position["areas_for_improvement"].append(
-                "High risk exposure limits strategic options"
-            )
+        position = {
+            "strength": sys.intern(strength.item()),
+            "growth_potential": sys.intern(growth_potential.item()),
+            "competitive_advantage": [],
+            "areas_for_improvement": []
+        }
         
-        # Profitability assessment
-        if profit_margin > 15:
-            position["competitive_advantage"].append(
-                "Healthy profit margins"
-            )
-        else:
-            position["areas_for_improvement"].append(
-                "Profitability requires improvement"
-            )
+        # Growth, risk and profitability notes, in that order
+        notes = (
+            _GROWTH_NOTES.get(position["growth_potential"]),
+            _RISK_NOTES.get(risk_evaluation.get('overall_risk', MEDIUM)),
+            _PROFITABILITY_NOTES[profit_margin > 15]
+        )
+        for note in notes:
+            if note is not None:
+                section, text = note
+                position[section].append(text)
         
         return position
     
@@ -156,207 +325,140 @@ class MarketStrategyAgent(Agent):
         self,
         data_analysis: Dict[str, Any],
         risk_evaluation: Dict[str, Any]
-    ) -> List[Dict[str, str]]:
+    ) -> List[Opportunity]:
         """Identify strategic opportunities"""
-        opportunities = []
-        
         metrics = data_analysis.get('metrics', {})
-        trends = data_analysis.get('trends', {})
-        
-        # Growth opportunities
-        if metrics.get('revenue_growth', 0) > 10:
-            opportunities.append({
-                "type": "Market Expansion",
-                "description": "Strong growth trend indicates market opportunity for expansion",
-                "priority": "High",
-                "potential_impact": "Significant revenue increase"
-            })
-        
-        # Efficiency opportunities
-        expense_ratio = metrics.get('expense_ratio', 0)
-        if expense_ratio > 70:
-            opportunities.append({
-                "type": "Cost Optimization",
-                "description": "High expense ratio presents opportunity for efficiency gains",
-                "priority": "Medium",
-                "potential_impact": "Improved profitability by 5-10%"
-            })
         
-        # Investment opportunities
-        if risk_evaluation.get('overall_risk') == 'Low':
-            opportunities.append({
-                "type": "Strategic Investment",
-                "description": "Low risk profile allows for strategic investments in growth",
-                "priority": "High",
-                "potential_impact": "Long-term competitive advantage"
-            })
-        
-        # Digital transformation
-        opportunities.append({
-            "type": "Digital Innovation",
-            "description": "Leverage technology for operational excellence",
-            "priority": "Medium",
-            "potential_impact": "15-20% efficiency improvement"
-        })
-        
-        return opportunities
+        return [
+            opportunity
+            for applies, opportunity in _OPPORTUNITY_RULES
+            if applies(metrics, risk_evaluation)
+        ]
     
     def _identify_threats(
         self,
         data_analysis: Dict[str, Any],
         risk_evaluation: Dict[str, Any]
-    ) -> List[Dict[str, str]]:
+    ) -> List[Threat]:
         """Identify strategic threats"""
-        threats = []
-        
         metrics = data_analysis.get('metrics', {})
         risk_factors = risk_evaluation.get('risk_factors', {})
         
-        # Market threats
-        market_risk = risk_factors.get('market_risk', {})
-        if market_risk.get('level') in ['High', 'Medium']:
-            threats.append({
-                "type": "Market Volatility",
-                "description": "High market volatility may impact revenue stability",
-                "severity": "High",
-                "mitigation": "Diversify revenue streams"
-            })
-        
-        # Financial threats
-        if metrics.get('profit_margin', 0) < 10:
-            threats.append({
-                "type": "Profitability Pressure",
-                "description": "Low margins vulnerable to cost increases",
-                "severity": "Medium",
-                "mitigation": "Implement cost management and pricing optimization"
-            })
-        
-        # Liquidity threats
-        liquidity_risk = risk_factors.get('liquidity_risk', {})
-        if liquidity_risk.get('level') == 'High':
-            threats.append({
-                "type": "Cash Flow Constraints",
-                "description": "Limited liquidity may restrict operational flexibility",
-                "severity": "High",
-                "mitigation": "Improve working capital management"
-            })
-        
-        # Competitive threats
-        if metrics.get('revenue_growth', 0) < 5:
-            threats.append({
-                "type": "Competitive Pressure",
-                "description": "Slow growth may indicate market share loss",
-                "severity": "Medium",
-                "mitigation": "Enhance competitive positioning and innovation"
-            })
-        
-        return threats
+        return [
+            threat
+            for applies, threat in _THREAT_RULES
+            if applies(metrics, risk_factors)
+        ]
     
     def _generate_strategic_recommendations(
         self,
-        strategy: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+        strategy: Dict[str, Any],
+        threats_by_severity: Dict[str, List[Threat]]
+    ) -> List[Recommendation]:
         """Generate prioritized strategic recommendations"""
         recommendations = []
         
         strategic_position = strategy.get('strategic_position', {})
-        opportunities = strategy.get('opportunities', [])
-        threats = strategy.get('threats', [])
         
         # Growth strategy recommendations
-        if strategic_position.get('growth_potential') == 'High':
-            recommendations.append({
-                "category": "Growth Strategy",
-                "recommendation": "Accelerate market expansion through strategic investments",
-                "rationale": "Strong growth momentum provides foundation for expansion",
-                "expected_outcome": "20-30% revenue increase within 12 months",
-                "priority": "High"
-            })
-        elif strategic_position.get('growth_potential') == 'Low':
-            recommendations.append({
-                "category": "Growth Strategy",
-                "recommendation": "Focus on market penetration and product innovation",
-                "rationale": "Need to revitalize growth through new offerings",
-                "expected_outcome": "Return to 10%+ growth rate",
-                "priority": "High"
-            })
+        if strategic_position.get('growth_potential') == HIGH:
+            recommendations.append(Recommendation(
+                category=_GROWTH_STRATEGY,
+                recommendation="Accelerate market expansion through strategic investments",
+                rationale="Strong growth momentum provides foundation for expansion",
+                expected_outcome="20-30% revenue increase within 12 months",
+                priority=HIGH
+            ))
+        elif strategic_position.get('growth_potential') == LOW:
+            recommendations.append(Recommendation(
+                category=_GROWTH_STRATEGY,
+                recommendation="Focus on market penetration and product innovation",
+                rationale="Need to revitalize growth through new offerings",
+                expected_outcome="Return to 10%+ growth rate",
+                priority=HIGH
+            ))
         
         # Risk mitigation recommendations
-        high_severity_threats = [t for t in threats if t.get('severity') == 'High']
-        if high_severity_threats:
-            recommendations.append({
-                "category": "Risk Management",
-                "recommendation": "Implement comprehensive risk mitigation framework",
-                "rationale": "High-severity threats require immediate attention",
-                "expected_outcome": "Reduce overall risk level to Medium",
-                "priority": "High"
-            })
+        if threats_by_severity.get(HIGH):
+            recommendations.append(Recommendation(
+                category="Risk Management",
+                recommendation="Implement comprehensive risk mitigation framework",
+                rationale="High-severity threats require immediate attention",
+                expected_outcome="Reduce overall risk level to Medium",
+                priority=HIGH
+            ))
         
         # Operational excellence
-        if strategic_position.get('strength') != 'Strong':
-            recommendations.append({
-                "category": "Operational Excellence",
-                "recommendation": "Launch operational improvement program",
-                "rationale": "Enhance efficiency and profitability",
-                "expected_outcome": "5-10% margin improvement",
-                "priority": "Medium"
-            })
+        if strategic_position.get('strength') != STRONG:
+            recommendations.append(Recommendation(
+                category="Operational Excellence",
+                recommendation="Launch operational improvement program",
+                rationale="Enhance efficiency and profitability",
+                expected_outcome="5-10% margin improvement",
+                priority=MEDIUM
+            ))
         
         # Innovation and transformation
-        recommendations.append({
-            "category": "Innovation",
-            "recommendation": "Invest in digital transformation initiatives",
-            "rationale": "Technology enables competitive advantage",
-            "expected_outcome": "Enhanced customer experience and efficiency",
-            "priority": "Medium"
-        })
+        recommendations.append(Recommendation(
+            category="Innovation",
+            recommendation="Invest in digital transformation initiatives",
+            rationale="Technology enables competitive advantage",
+            expected_outcome="Enhanced customer experience and efficiency",
+            priority=MEDIUM
+        ))
         
         return recommendations
     
-    def _create_action_plan(self, strategy: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _create_action_plan(
+        self,
+        recommendations_by_priority: Dict[str, List[Recommendation]]
+    ) -> List[Dict[str, Any]]:
         """Create detailed action plan with timelines"""
         action_plan = []
-        recommendations = strategy.get('recommendations', [])
         
         # Prioritize high-priority recommendations
-        high_priority = [r for r in recommendations if r.get('priority') == 'High']
+        high_priority = recommendations_by_priority.get(HIGH, [])
         
         for idx, rec in enumerate(high_priority[:3], 1):
             action_plan.append({
                 "action_number": idx,
-                "action": rec.get('recommendation'),
-                "category": rec.get('category'),
+                "action": rec.recommendation,
+                "category": rec.category,
                 "timeline": "0-3 months" if idx == 1 else "3-6 months",
                 "resources_required": "Executive sponsorship, cross-functional team",
-                "success_metrics": rec.get('expected_outcome'),
+                "success_metrics": rec.expected_outcome,
                 "dependencies": "Management approval and budget allocation"
             })
         
         # Add medium priority actions
-        medium_priority = [r for r in recommendations if r.get('priority') == 'Medium']
+        medium_priority = recommendations_by_priority.get(MEDIUM, [])
         for idx, rec in enumerate(medium_priority[:2], len(action_plan) + 1):
             action_plan.append({
                 "action_number": idx,
-                "action": rec.get('recommendation'),
-                "category": rec.get('category'),
+                "action": rec.recommendation,
+                "category": rec.category,
                 "timeline": "6-12 months",
                 "resources_required": "Dedicated project team",
-                "success_metrics": rec.get('expected_outcome'),
+                "success_metrics": rec.expected_outcome,
                 "dependencies": "Completion of high-priority actions"
             })
         
         return action_plan
     
-    def _extract_key_points(self, strategy: Dict[str, Any]) -> List[str]:
+    def _extract_key_points(
+        self,
+        strategy: Dict[str, Any],
+        threats_by_severity: Dict[str, List[Threat]]
+    ) -> List[str]:
         """Extract key strategic points"""
         key_points = []
         
         position = strategy.get('strategic_position', {})
         key_points.append(
-            f"Strategic Strength: {position.get('strength', 'Medium')}"
+            f"Strategic Strength: {position.get('strength', MEDIUM)}"
         )
         key_points.append(
-            f"Growth Potential: {position.get('growth_potential', 'Medium')}"
+            f"Growth Potential: {position.get('growth_potential', MEDIUM)}"
         )
         
         opportunities = strategy.get('opportunities', [])
@@ -365,8 +467,7 @@ class MarketStrategyAgent(Agent):
                 f"Identified {len(opportunities)} strategic opportunities"
             )
         
-        threats = strategy.get('threats', [])
-        high_threats = [t for t in threats if t.get('severity') == 'High']
+        high_threats = threats_by_severity.get(HIGH, [])
         if high_threats:
             key_points.append(
                 f"Critical: {len(high_threats)} high-severity threats require attention"
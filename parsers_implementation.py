@@ -3,12 +3,337 @@ File Parsers for Multiple Formats
 Handles CSV, Excel, PDF, and DOCX files
 """
 import pandas as pd
-import PyPDF2
+import numpy as np
+import pypdfium2 as pdfium
 import pdfplumber
-from docx import Document
+import importlib.util
 import json
-from typing import Dict, Any, List
+import logging
+import multiprocessing
+import os
+import re
+import zipfile
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Rust-based Excel reader, used when the python-calamine extra is installed
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# Open PDF documents accepted by the PDF extraction helpers
+PdfSource = Union["pdfium.PdfDocument", "pdfplumber.PDF"]
+
+# PDFs with at least this many pages are extracted on a process pool,
+# in tasks of _PDF_PAGES_PER_TASK consecutive pages
+_PARALLEL_PDF_PAGES = 64
+_PDF_PAGES_PER_TASK = 16
+
+# Financial terms followed by an amount, e.g. "Revenue: $1,200,000"
+_METRICS_RE = re.compile(
+    r'(?P<key>revenue|profit|expenses)[:\s]+\$?(?P<value>[\d,]+)',
+    re.IGNORECASE
+)
+
+# WordprocessingML main part and the element tags read from it
+_DOCX_DOCUMENT = 'word/document.xml'
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY, _W_P, _W_TBL, _W_TR, _W_TC = (
+    _W + 'body', _W + 'p', _W + 'tbl', _W + 'tr', _W + 'tc'
+)
+
+# Run children that contribute text, and the text they stand for
+# (None: the element's own text)
+_RUN_TEXT = {_W + 't': None, _W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n'}
+
+# Leading bytes of PDF files and of zip containers (xlsx, docx)
+_PDF_SIGNATURE = b'%PDF'
+_ZIP_SIGNATURE = b'PK\x03\x04'
+
+# Number of parse results ParserFactory keeps in memory
+_PARSE_CACHE_SIZE = 64
+
+# Installed pandas major version; copy-on-write is always on from 3
+_PANDAS_MAJOR = int(pd.__version__.split('.')[0])
+
+# A table as extracted from a document: rows of cell values, header first
+RawTable = List[List[Any]]
+
+# Translation table deleting currency symbols and thousands separators
+_CURRENCY_CHARS = str.maketrans('', '', '$,')
+
+# PARSER_PRECISION value that lets numeric columns be stored in narrow dtypes
+_FLOAT32_PRECISION = 'fp32'
+
+# Truthy values of the PARSER_PARALLEL_SHEETS flag
+_TRUTHY = ('1', 'true', 'yes', 'on')
+
+
+def _coerce_columns(df: pd.DataFrame, converted: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace columns of df with their converted versions where conversion is lossless
+    
+    A converted column is kept only if it introduces no new missing values,
+    i.e. every value that was present in df parsed successfully.
+    """
+    lossless = (converted.notna() | df[converted.columns].isna()).all()
+    keep = converted.columns[lossless.to_numpy()]
+    if len(keep):
+        df = df.copy()
+        for col in keep:
+            df[col] = converted[col]
+    return df
+
+
+def _coerce_currency(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert text columns of amounts such as "$1,200" to numbers
+    
+    Dollar signs and thousands separators are deleted with a single
+    str.translate pass per column. As with pd.to_numeric, a column is converted only if
+    every non-blank cell parses; blank cells become NaN.
+    """
+    text = df.select_dtypes(include=['object', 'string'])
+    if not len(text.columns) or not df.columns.is_unique:
+        return df
+    
+    stripped = text.apply(lambda values: values.str.translate(_CURRENCY_CHARS))
+    converted = stripped.apply(pd.to_numeric, errors='coerce')
+    parsed = (converted.notna() | stripped.isna() | stripped.eq('')).all()
+    
+    keep = converted.columns[parsed.to_numpy()]
+    if len(keep):
+        df = df.copy()
+        for col in keep:
+            df[col] = converted[col]
+    return df
+
+
+def _parser_precision() -> str:
+    """The PARSER_PRECISION setting, normalized"""
+    return os.getenv('PARSER_PRECISION', '').strip().lower()
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store numeric columns in the smallest dtype that holds their values
+    
+    Only done when PARSER_PRECISION is 'fp32'; otherwise columns keep
+    pandas' int64/float64. Narrow integers wrap on overflow in later
+    arithmetic (int8 revenue * expenses), and pandas accepts near-equal
+    values when downcasting floats, so callers have to opt in.
+    """
+    if not df.columns.is_unique or _parser_precision() != _FLOAT32_PRECISION:
+        return df
+    
+    kinds = {'integer': np.integer, 'float': np.floating}
+    
+    downcast = {}
+    for kind, dtype in kinds.items():
+        for col in df.select_dtypes(include=[dtype]).columns:
+            narrowed = pd.to_numeric(df[col], downcast=kind)
+            if narrowed.dtype != df[col].dtype:
+                downcast[col] = narrowed
+    
+    if downcast:
+        df = df.copy()
+        for col, values in downcast.items():
+            df[col] = values
+    return df
+
+
+def _date_columns(df: pd.DataFrame) -> List[Any]:
+    """Columns whose name marks them as dates"""
+    return [col for col in df.columns if 'date' in str(col).lower()]
+
+
+def _table_frame(rows: RawTable) -> pd.DataFrame:
+    """DataFrame of a raw table whose first row holds the column names"""
+    return pd.DataFrame(rows[1:], columns=rows[0])
+
+
+def _pdf_page_range(file_path: str, start: int, stop: int) -> Tuple[str, List[RawTable]]:
+    """
+    Extract text and raw tables for pages [start, stop) of a PDF
+    
+    Runs in a worker process, so it opens its own documents and returns
+    only picklable text and nested lists.
+    """
+    text = ""
+    document = pdfium.PdfDocument(file_path)
+    try:
+        for index in range(start, stop):
+            page = document[index]
+            textpage = page.get_textpage()
+            text += textpage.get_text_range()
+            textpage.close()
+            page.close()
+    finally:
+        document.close()
+    
+    tables = []
+    try:
+        with pdfplumber.open(file_path, pages=range(start + 1, stop + 1)) as pdf:
+            for page in pdf.pages:
+                tables.extend(table for table in page.extract_tables() if table)
+    except Exception as e:
+        logger.warning("Table extraction warning: %s", e)
+    
+    return text, tables
+
+
+@lru_cache(maxsize=None)
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for parser worker pools
+    
+    Pools are started from parse threads, and forking a threaded process
+    can deadlock the child on locks held by other threads, so workers
+    come from a forkserver (which preloads this module once) or are
+    spawned where that is unavailable.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _match_metrics(text: str, keys: Tuple[str, ...]) -> Dict[str, float]:
+    """
+    Extract the first amount following each of the given financial terms
+    
+    Scans the text once with _METRICS_RE, stopping as soon as every term
+    has been seen. A term whose first amount is not a number (e.g. a lone
+    comma) is left out, as are terms not in keys.
+    """
+    metrics = {}
+    seen = set()
+    
+    for match in _METRICS_RE.finditer(text):
+        key = match.group('key').lower()
+        if key in seen or key not in keys:
+            continue
+        seen.add(key)
+        try:
+            metrics[key] = float(match.group('value').replace(',', ''))
+        except ValueError:
+            pass
+        if len(seen) == len(keys):
+            break
+    
+    return metrics
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_cached(
+    file_path: str, 
+    mtime_ns: int, 
+    size: int, 
+    precision: str
+) -> Dict[str, Any]:
+    """
+    Parse a file once per (path, modification time, size, precision)
+    
+    The stat fields and the PARSER_PRECISION setting are only part of the
+    cache key, so an edited file, or one parsed under a different
+    precision, is parsed again. Failed parses raise and are not cached.
+    """
+    return ParserFactory.get_parser(file_path).parse(file_path)
+
+
+def _frame_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy of a DataFrame whose in-place changes never reach df
+    
+    Under copy-on-write (always on from pandas 3, opt-in on 2.x) a shallow
+    copy is enough, as both sides share data only until one writes to it.
+    Without it a shallow copy writes through, so the data is copied.
+    """
+    copy_on_write = _PANDAS_MAJOR >= 3 or pd.options.mode.copy_on_write is True
+    return df.copy(deep=not copy_on_write)
+
+
+def _detached(value: Any) -> Any:
+    """
+    Copy of a parse result that callers can change without touching the cache
+    
+    Dicts, lists, DataFrames and lazy table/sheet containers are copied
+    all the way down, DataFrames with _frame_copy.
+    """
+    if isinstance(value, pd.DataFrame):
+        return _frame_copy(value)
+    if isinstance(value, (LazyTables, LazySheets)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _detached(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detached(item) for item in value]
+    return value
+
+
+def _paragraph_text(paragraph: "etree._Element") -> str:
+    """Text of a w:p element from its runs, including runs inside hyperlinks"""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W + 'hyperlink':
+            runs = child.iterchildren(_W + 'r')
+        elif child.tag == _W + 'r':
+            runs = (child,)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                if item.tag in _RUN_TEXT:
+                    parts.append(_RUN_TEXT[item.tag] or item.text or '')
+    return ''.join(parts)
+
+
+def _table_rows(table: "etree._Element") -> List[List[str]]:
+    """
+    Cell texts of a w:tbl element laid out on the table grid
+    
+    A cell spanning several grid columns (w:gridSpan) repeats its text in
+    each of them, and a vertically merged cell (w:vMerge) repeats the text
+    of the cell above, as python-docx's row.cells does.
+    """
+    rows = []
+    above = []
+    for tr in table.iterchildren(_W_TR):
+        row = []
+        for tc in tr.iterchildren(_W_TC):
+            span = tc.find(f'{_W}tcPr/{_W}gridSpan')
+            merge = tc.find(f'{_W}tcPr/{_W}vMerge')
+            width = int(span.get(_W + 'val')) if span is not None else 1
+            
+            column = len(row)
+            if merge is not None and merge.get(_W + 'val', 'continue') == 'continue' \
+                    and column < len(above):
+                text = above[column]
+            else:
+                text = '\n'.join(
+                    _paragraph_text(p) for p in tc.iterchildren(_W_P)
+                )
+            row.extend([text] * width)
+        rows.append(row)
+        above = row
+    return rows
+
+
+def _numeric_summary(df: pd.DataFrame, stats: Tuple[str, ...]) -> Dict[str, Dict[str, float]]:
+    """Per-column summary statistics of the numeric columns, in one agg call"""
+    numeric = df.select_dtypes(include=['number'])
+    if not len(numeric.columns):
+        return {}
+    
+    # One cast of the whole stats table; to_dict() yields plain Python floats
+    return numeric.agg(list(stats)).astype('float64').to_dict()
 
 
 class BaseParser:
@@ -44,10 +369,11 @@ class CSVParser(BaseParser):
         """
         try:
             # Read CSV with pandas
-            df = pd.read_csv(file_path)
+            df = self._read_csv(file_path)
             
             # Basic data cleaning
             df = self._clean_data(df)
+            summary = self._generate_summary(df)
             
             # Extract metadata
             metadata = self._extract_metadata(df, file_path)
@@ -58,36 +384,48 @@ class CSVParser(BaseParser):
                 "metadata": metadata,
                 "columns": list(df.columns),
                 "total_records": len(df),
-                "summary": self._generate_summary(df)
+                "summary": summary
             }
             
             return result
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise Exception(f"CSV parsing failed: {str(e)}")
     
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Read CSV with the multi-threaded pyarrow engine, else the C engine"""
+        try:
+            return pd.read_csv(file_path, engine="pyarrow")
+        except (ImportError, ValueError) as e:
+            # pyarrow missing, or input the Arrow reader rejects
+            logger.debug("pyarrow CSV reader unavailable for %s: %s", file_path, e)
+            return pd.read_csv(file_path)
+    
     def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess CSV data"""
         # Remove empty rows
         df = df.dropna(how='all')
         
         # Convert date columns
-        for col in df.columns:
-            if 'date' in col.lower():
-                try:
-                    df[col] = pd.to_datetime(df[col])
-                except:
-                    pass
+        date_cols = _date_columns(df)
+        if date_cols:
+            df = _coerce_columns(
+                df, df[date_cols].apply(pd.to_datetime, errors='coerce')
+            )
         
-        # Convert numeric columns
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                try:
-                    df[col] = pd.to_numeric(df[col].str.replace(',', ''))
-                except:
-                    pass
+        # Convert numeric text columns, dropping thousands separators
+        text = df.select_dtypes(include=['object', 'string'])
+        if len(text.columns):
+            df = _coerce_columns(df, text.apply(
+                lambda values: pd.to_numeric(
+                    values.astype(str).str.replace(',', '', regex=False),
+                    errors='coerce'
+                )
+            ))
         
-        return df
+        return _downcast_numeric(df)
     
     def _extract_metadata(self, df: pd.DataFrame, file_path: str) -> Dict[str, Any]:
         """Extract metadata from CSV data"""
@@ -100,7 +438,7 @@ class CSVParser(BaseParser):
         }
         
         # Detect date range if date column exists
-        date_cols = [col for col in df.columns if 'date' in col.lower()]
+        date_cols = _date_columns(df)
         if date_cols:
             date_col = date_cols[0]
             metadata["date_range"] = f"{df[date_col].min()} to {df[date_col].max()}"
@@ -109,18 +447,90 @@ class CSVParser(BaseParser):
     
     def _generate_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Generate statistical summary of CSV data"""
-        summary = {}
-        
-        numeric_cols = df.select_dtypes(include=['number']).columns
-        for col in numeric_cols:
-            summary[col] = {
-                "mean": float(df[col].mean()),
-                "sum": float(df[col].sum()),
-                "min": float(df[col].min()),
-                "max": float(df[col].max())
-            }
-        
-        return summary
+        return _numeric_summary(df, ('mean', 'sum', 'min', 'max'))
+
+
+class LazyTables(Sequence):
+    """
+    Extracted tables, each turned into a DataFrame on first access
+    
+    Documents often contain many small tables of which only the first is
+    used, so the rest stay raw row lists until they are read.
+    """
+    
+    def __init__(
+        self, 
+        raw_tables: List[RawTable], 
+        loaded: Optional[Dict[int, pd.DataFrame]] = None
+    ):
+        self._raw_tables = raw_tables
+        self._loaded = dict(loaded or {})
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        if index not in self._loaded:
+            self._loaded[index] = _table_frame(self._raw_tables[index])
+        return self._loaded[index]
+    
+    def __len__(self) -> int:
+        return len(self._raw_tables)
+    
+    def copy(self) -> "LazyTables":
+        """Independent copy, including the tables already loaded"""
+        return LazyTables(
+            self._raw_tables,
+            {index: _frame_copy(df) for index, df in self._loaded.items()}
+        )
+
+
+class LazySheets(Mapping):
+    """
+    Excel sheets keyed by name, each read and cleaned on first access
+    
+    Holds the workbook path rather than an open handle so parse results
+    stay picklable; the workbook is only reopened for sheets that are
+    actually read.
+    """
+    
+    def __init__(
+        self, 
+        file_path: str, 
+        sheet_names: List[str], 
+        clean: Callable[[pd.DataFrame], pd.DataFrame], 
+        engine: Optional[str] = None, 
+        loaded: Optional[Dict[str, pd.DataFrame]] = None
+    ):
+        self._file_path = file_path
+        self._sheet_names = list(sheet_names)
+        self._clean = clean
+        self._engine = engine
+        self._loaded = dict(loaded or {})
+    
+    def __getitem__(self, sheet_name: str) -> pd.DataFrame:
+        if sheet_name not in self._loaded:
+            if sheet_name not in self._sheet_names:
+                raise KeyError(sheet_name)
+            df = pd.read_excel(self._file_path, sheet_name=sheet_name, engine=self._engine)
+            self._loaded[sheet_name] = self._clean(df)
+        return self._loaded[sheet_name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sheet_names)
+    
+    def __len__(self) -> int:
+        return len(self._sheet_names)
+    
+    def copy(self) -> "LazySheets":
+        """Independent copy, including the sheets already loaded"""
+        return LazySheets(
+            self._file_path,
+            self._sheet_names,
+            self._clean,
+            self._engine,
+            {name: _frame_copy(df) for name, df in self._loaded.items()}
+        )
 
 
 class ExcelParser(BaseParser):
@@ -137,18 +547,24 @@ class ExcelParser(BaseParser):
             Standardized data dictionary
         """
         try:
-            # Read all sheets
-            excel_file = pd.ExcelFile(file_path)
-            sheets_data = {}
+            # Open the workbook once; only the primary (first) sheet is
+            # read now, the others when first accessed
+            with pd.ExcelFile(file_path, engine=_EXCEL_ENGINE) as excel_file:
+                sheet_names = excel_file.sheet_names
+                primary_sheet = sheet_names[0]
+                if len(sheet_names) > 1 and self._parallel_sheets():
+                    loaded = self._read_sheets_parallel(file_path, sheet_names)
+                else:
+                    loaded = {primary_sheet: self._clean_data(excel_file.parse(primary_sheet))}
             
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-                df = self._clean_data(df)
-                sheets_data[sheet_name] = df
-            
-            # Use first sheet as primary data
-            primary_sheet = excel_file.sheet_names[0]
-            primary_df = sheets_data[primary_sheet]
+            primary_df = loaded[primary_sheet]
+            sheets_data = LazySheets(
+                file_path, 
+                sheet_names, 
+                self._clean_data, 
+                engine=_EXCEL_ENGINE, 
+                loaded=loaded
+            )
             
             metadata = self._extract_metadata(sheets_data, file_path)
             
@@ -156,7 +572,7 @@ class ExcelParser(BaseParser):
                 "parsed_data": primary_df,
                 "all_sheets": sheets_data,
                 "metadata": metadata,
-                "sheet_names": excel_file.sheet_names,
+                "sheet_names": sheet_names,
                 "columns": list(primary_df.columns),
                 "total_records": len(primary_df),
                 "summary": self._generate_summary(primary_df)
@@ -164,25 +580,45 @@ class ExcelParser(BaseParser):
             
             return result
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise Exception(f"Excel parsing failed: {str(e)}")
     
+    def _parallel_sheets(self) -> bool:
+        """Whether PARSER_PARALLEL_SHEETS asks for all sheets to be read up front"""
+        return os.getenv('PARSER_PARALLEL_SHEETS', '').strip().lower() in _TRUTHY
+    
+    def _read_sheets_parallel(
+        self, 
+        file_path: str, 
+        sheet_names: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """Read and clean every sheet on a thread pool, one reader per sheet"""
+        def read_sheet(sheet_name: str) -> pd.DataFrame:
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
+            return self._clean_data(df)
+        
+        workers = min(len(sheet_names), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(sheet_names, executor.map(read_sheet, sheet_names)))
+    
     def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess Excel data"""
-        # Remove completely empty rows and columns
-        df = df.dropna(how='all').dropna(axis=1, how='all')
+        # Remove completely empty rows and columns from one notna() pass
+        present = df.notna()
+        df = df.loc[present.any(axis=1), present.any(axis=0)]
         
         # Convert date columns
-        for col in df.columns:
-            if 'date' in str(col).lower():
-                try:
-                    df[col] = pd.to_datetime(df[col])
-                except:
-                    pass
+        date_cols = _date_columns(df)
+        if date_cols:
+            df = _coerce_columns(
+                df, df[date_cols].apply(pd.to_datetime, errors='coerce')
+            )
         
-        return df
+        return _downcast_numeric(df)
     
-    def _extract_metadata(self, sheets_data: Dict, file_path: str) -> Dict[str, Any]:
+    def _extract_metadata(self, sheets_data: Mapping, file_path: str) -> Dict[str, Any]:
         """Extract metadata from Excel file"""
         metadata = {
             "source": file_path,
@@ -196,16 +632,7 @@ class ExcelParser(BaseParser):
     
     def _generate_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Generate summary statistics"""
-        summary = {}
-        numeric_cols = df.select_dtypes(include=['number']).columns
-        
-        for col in numeric_cols:
-            summary[col] = {
-                "mean": float(df[col].mean()),
-                "sum": float(df[col].sum())
-            }
-        
-        return summary
+        return _numeric_summary(df, ('mean', 'sum'))
 
 
 class PDFParser(BaseParser):
@@ -222,21 +649,52 @@ class PDFParser(BaseParser):
             Standardized data dictionary
         """
         try:
-            # Extract text
-            text_content = self._extract_text(file_path)
+            # PDFium reads text and the page count. pdfplumber is opened
+            # separately for tables, so a file only PDFium can read still
+            # parses, without tables.
+            try:
+                document = pdfium.PdfDocument(file_path)
+            except pdfium.PdfiumError:
+                document = None
             
-            # Extract tables
-            tables = self._extract_tables(file_path)
+            if document is None:
+                # pdfplumber is the only reader left, for text and tables
+                with pdfplumber.open(file_path) as pdf:
+                    page_count = self._get_page_count(pdf)
+                    text_content = self._extract_text(pdf)
+                    raw_tables = self._extract_tables(pdf)
+            else:
+                try:
+                    page_count = self._get_page_count(document)
+                    parallel = page_count >= _PARALLEL_PDF_PAGES
+                    if not parallel:
+                        # Extract text
+                        text_content = self._extract_text(document)
+                finally:
+                    document.close()
+                
+                if parallel:
+                    # Long document: extract page ranges in parallel
+                    text_content, raw_tables = self._extract_parallel(file_path, page_count)
+                else:
+                    # Extract tables
+                    raw_tables = self._extract_tables(file_path)
             
             # Parse financial data from text
-            financial_data = self._parse_financial_data(text_content, tables)
+            financial_data = self._parse_financial_data(text_content, raw_tables)
+            
+            # Only the primary table is built up front; the converted
+            # version is what the returned tables hold
+            tables = LazyTables(
+                raw_tables, {0: financial_data} if raw_tables else None
+            )
             
             metadata = {
                 "source": file_path,
                 "parser": "PDFParser",
                 "timestamp": datetime.now().isoformat(),
-                "pages": self._get_page_count(file_path),
-                "has_tables": len(tables) > 0
+                "pages": page_count,
+                "has_tables": bool(raw_tables)
             }
             
             result = {
@@ -248,64 +706,95 @@ class PDFParser(BaseParser):
             
             return result
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise Exception(f"PDF parsing failed: {str(e)}")
     
-    def _extract_text(self, file_path: str) -> str:
-        """Extract text from PDF"""
-        text = ""
+    def _extract_parallel(
+        self, 
+        file_path: str, 
+        page_count: int
+    ) -> Tuple[str, List[RawTable]]:
+        """Extract text and raw tables of a long PDF on a process pool, in page order"""
+        starts = range(0, page_count, _PDF_PAGES_PER_TASK)
+        stops = [min(start + _PDF_PAGES_PER_TASK, page_count) for start in starts]
         
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-        except:
-            # Fallback to pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text()
+        # Called with no documents open: workers open their own
+        workers = min(len(starts), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_worker_context()) as executor:
+            parts = list(executor.map(_pdf_page_range, repeat(file_path), starts, stops))
+        
+        text = "".join(part_text for part_text, _ in parts)
+        tables = [table for _, part_tables in parts for table in part_tables]
+        return text, tables
+    
+    def _extract_text(self, source: Union[str, PdfSource]) -> str:
+        """Extract text from a PDF path or an already-open document"""
+        if isinstance(source, str):
+            try:
+                document = pdfium.PdfDocument(source)
+            except pdfium.PdfiumError:
+                # Fallback to pdfplumber
+                with pdfplumber.open(source) as pdf:
+                    return self._extract_text(pdf)
+            
+            try:
+                return self._extract_text(document)
+            finally:
+                document.close()
+        
+        text = ""
+        if isinstance(source, pdfium.PdfDocument):
+            # Native PDFium text extraction
+            for page in source:
+                textpage = page.get_textpage()
+                text += textpage.get_text_range()
+                textpage.close()
+                page.close()
+        else:
+            for page in source.pages:
+                text += page.extract_text() or ""
         
         return text
     
-    def _extract_tables(self, file_path: str) -> List[pd.DataFrame]:
-        """Extract tables from PDF"""
+    def _extract_tables(self, source: Union[str, "pdfplumber.PDF"]) -> List[RawTable]:
+        """
+        Extract raw tables from a PDF path or an open pdfplumber document
+        
+        Failures, including pdfplumber being unable to open the path, are
+        logged and yield the tables found so far.
+        """
+        if isinstance(source, str):
+            try:
+                with pdfplumber.open(source) as pdf:
+                    return self._extract_tables(pdf)
+            except Exception as e:
+                logger.warning("Table extraction warning: %s", e)
+                return []
+        
         tables = []
         
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_tables = page.extract_tables()
-                    for table in page_tables:
-                        if table:
-                            df = pd.DataFrame(table[1:], columns=table[0])
-                            tables.append(df)
+            for page in source.pages:
+                tables.extend(table for table in page.extract_tables() if table)
         except Exception as e:
-            print(f"Table extraction warning: {str(e)}")
+            logger.warning("Table extraction warning: %s", e)
         
         return tables
     
     def _parse_financial_data(
         self, 
         text: str, 
-        tables: List[pd.DataFrame]
-    ) -> Dict[str, Any]:
-        """Parse financial data from text and tables"""
+        tables: List[RawTable]
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """Parse financial data from text and raw tables, keeping tables columnar"""
         financial_data = {}
         
-        # If tables exist, use first table as primary data
+        # If tables exist, use first table as primary data, with currency
+        # columns converted to numeric
         if tables:
-            primary_table = tables[0]
-            # Try to convert to numeric
-            for col in primary_table.columns:
-                try:
-                    primary_table[col] = pd.to_numeric(
-                        primary_table[col].str.replace(',', '').str.replace('$', '')
-                    )
-                except:
-                    pass
-            
-            financial_data = primary_table.to_dict()
+            financial_data = _coerce_currency(_table_frame(tables[0]))
         else:
             # Extract key financial terms from text
             financial_data = self._extract_key_metrics(text)
@@ -314,35 +803,25 @@ class PDFParser(BaseParser):
     
     def _extract_key_metrics(self, text: str) -> Dict[str, Any]:
         """Extract key financial metrics from text"""
-        metrics = {}
-        
         # Simple pattern matching for common financial terms
-        import re
-        
-        patterns = {
-            'revenue': r'revenue[:\s]+\$?([\d,]+)',
-            'profit': r'profit[:\s]+\$?([\d,]+)',
-            'expenses': r'expenses[:\s]+\$?([\d,]+)'
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    metrics[key] = float(match.group(1).replace(',', ''))
-                except:
-                    pass
-        
-        return metrics
+        return _match_metrics(text, ('revenue', 'profit', 'expenses'))
     
-    def _get_page_count(self, file_path: str) -> int:
-        """Get number of pages in PDF"""
+    def _get_page_count(self, source: Union[str, PdfSource]) -> int:
+        """Get number of pages in a PDF path or an already-open document"""
+        if isinstance(source, pdfium.PdfDocument):
+            return len(source)
+        if not isinstance(source, str):
+            return len(source.pages)
+        
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                return len(pdf_reader.pages)
-        except:
+            pdf = pdfium.PdfDocument(source)
+        except pdfium.PdfiumError:
             return 0
+        
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
 
 
 class DOCXParser(BaseParser):
@@ -359,23 +838,25 @@ class DOCXParser(BaseParser):
             Standardized data dictionary
         """
         try:
-            doc = Document(file_path)
+            # Extract paragraphs and tables in one streaming pass
+            paragraphs, rows_per_table = self._read_body(file_path)
             
-            # Extract paragraphs
-            text_content = self._extract_text(doc)
+            text_content = '\n'.join(text for text in paragraphs if text.strip())
             
-            # Extract tables
-            tables = self._extract_tables(doc)
+            raw_tables = [rows for rows in rows_per_table if rows]
             
             # Parse financial data
-            financial_data = self._parse_financial_data(text_content, tables)
+            financial_data = self._parse_financial_data(text_content, raw_tables)
+            tables = LazyTables(
+                raw_tables, {0: financial_data} if raw_tables else None
+            )
             
             metadata = {
                 "source": file_path,
                 "parser": "DOCXParser",
                 "timestamp": datetime.now().isoformat(),
-                "paragraphs": len(doc.paragraphs),
-                "tables": len(doc.tables)
+                "paragraphs": len(paragraphs),
+                "tables": len(rows_per_table)
             }
             
             result = {
@@ -387,45 +868,60 @@ class DOCXParser(BaseParser):
             
             return result
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise Exception(f"DOCX parsing failed: {str(e)}")
     
-    def _extract_text(self, doc: Document) -> str:
-        """Extract text from DOCX"""
-        text = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text.append(paragraph.text)
-        return '\n'.join(text)
-    
-    def _extract_tables(self, doc: Document) -> List[pd.DataFrame]:
-        """Extract tables from DOCX"""
+    def _read_body(self, file_path: str) -> Tuple[List[str], List[List[List[str]]]]:
+        """
+        Stream word/document.xml and collect top-level paragraphs and tables
+        
+        Returns the text of every body paragraph (empty ones included) and
+        the cell texts of every body table, row by row. Body elements are
+        cleared once read, so memory stays flat on large documents.
+        """
+        paragraphs = []
         tables = []
         
-        for table in doc.tables:
-            data = []
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                data.append(row_data)
-            
-            if data:
-                df = pd.DataFrame(data[1:], columns=data[0])
-                tables.append(df)
+        with zipfile.ZipFile(file_path) as archive, archive.open(_DOCX_DOCUMENT) as xml:
+            # Uploaded documents are untrusted: never expand entities or
+            # fetch anything they reference, whatever the lxml version
+            elements = etree.iterparse(
+                xml,
+                events=('end',),
+                tag=(_W_P, _W_TBL),
+                resolve_entities=False,
+                no_network=True
+            )
+            for _, element in elements:
+                parent = element.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    continue
+                
+                if element.tag == _W_P:
+                    paragraphs.append(_paragraph_text(element))
+                else:
+                    tables.append(_table_rows(element))
+                
+                # Drop the processed element and everything before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
         
-        return tables
+        return paragraphs, tables
     
     def _parse_financial_data(
         self, 
         text: str, 
-        tables: List[pd.DataFrame]
-    ) -> Dict[str, Any]:
-        """Parse financial data from DOCX content"""
+        tables: List[RawTable]
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """Parse financial data from DOCX content, keeping tables columnar"""
         financial_data = {}
         
         if tables:
             # Use first table
-            primary_table = tables[0]
-            financial_data = primary_table.to_dict()
+            financial_data = _table_frame(tables[0])
         else:
             # Extract from text
             financial_data = self._extract_key_metrics(text)
@@ -434,23 +930,95 @@ class DOCXParser(BaseParser):
     
     def _extract_key_metrics(self, text: str) -> Dict[str, Any]:
         """Extract financial metrics from text"""
-        metrics = {}
-        
-        import re
-        patterns = {
-            'revenue': r'revenue[:\s]+\$?([\d,]+)',
-            'profit': r'profit[:\s]+\$?([\d,]+)'
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    metrics[key] = float(match.group(1).replace(',', ''))
-                except:
-                    pass
+        return _match_metrics(text, ('revenue', 'profit'))
+
+
+# Parser class for each supported file extension
+_PARSERS = {
+    'csv': CSVParser,
+    'xlsx': ExcelParser,
+    'xls': ExcelParser,
+    'pdf': PDFParser,
+    'docx': DOCXParser
+}
+
+
+def _to_arrow(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a parse result whose DataFrame row data is a pyarrow.Table"""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Arrow output requires the optional pyarrow package") from e
+    
+    result = dict(result)
+    if isinstance(result.get('parsed_data'), pd.DataFrame):
+        result['parsed_data'] = pa.Table.from_pandas(
+            result['parsed_data'], preserve_index=False
+        )
+    return result
+
+
+def _parse_in_worker(file_path: str, return_exceptions: bool, mutable: bool = True) -> Any:
+    """
+    Parse one file for parse_many
+    
+    Worker processes pickle the result back, so they can skip copying the
+    cached result; parses in the calling process pass mutable=False.
+    """
+    try:
+        return ParserFactory.parse_file(file_path, mutable=mutable)
+    except Exception as e:
+        if return_exceptions:
+            return e
+        raise
+
+
+def _file_format(file_path: str) -> str:
+    """
+    Format of a file: its extension, corrected by the file's leading bytes
+    
+    Files that cannot be read are classified by extension alone.
+    """
+    extension = Path(file_path).suffix.lower()[1:]
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return extension
+    return _sniff_format(os.path.abspath(file_path), stat.st_mtime_ns, extension)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _sniff_format(file_path: str, mtime_ns: int, extension: str) -> str:
+    """
+    Classify a file from its signature, falling back to its extension
+    
+    PDFs are recognised by their header. Zip containers are told apart by
+    their members, so a workbook or document with a misleading extension
+    still reaches the right parser.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            signature = f.read(8)
         
-        return metrics
+        if signature.startswith(_PDF_SIGNATURE):
+            return 'pdf'
+        if signature.startswith(_ZIP_SIGNATURE):
+            with zipfile.ZipFile(file_path) as archive:
+                names = archive.namelist()
+            if _DOCX_DOCUMENT in names:
+                return 'docx'
+            if any(name.startswith('xl/') for name in names):
+                return 'xlsx'
+    except (OSError, zipfile.BadZipFile):
+        pass
+    
+    return extension
+
+
+@lru_cache(maxsize=None)
+def _parser_instance(parser_class: type) -> BaseParser:
+    """Shared instance of a parser class; parsers keep no per-file state"""
+    return parser_class()
 
 
 class ParserFactory:
@@ -465,34 +1033,92 @@ class ParserFactory:
             file_path: Path to file
             
         Returns:
-            Parser instance
+            Parser instance, shared between calls for the same format
         """
-        extension = file_path.lower().split('.')[-1]
-        
-        parsers = {
-            'csv': CSVParser,
-            'xlsx': ExcelParser,
-            'xls': ExcelParser,
-            'pdf': PDFParser,
-            'docx': DOCXParser
-        }
+        file_format = _file_format(file_path)
         
-        parser_class = parsers.get(extension)
+        parser_class = _PARSERS.get(file_format)
         if not parser_class:
-            raise ValueError(f"Unsupported file format: {extension}")
+            raise ValueError(f"Unsupported file format: {file_format}")
         
-        return parser_class()
+        return _parser_instance(parser_class)
     
     @staticmethod
-    def parse_file(file_path: str) -> Dict[str, Any]:
+    def parse_file(
+        file_path: str, 
+        mutable: bool = False, 
+        output: str = 'pandas'
+    ) -> Dict[str, Any]:
         """
         Parse file using appropriate parser
         
+        Results are cached in memory while the file is unchanged.
+        
         Args:
             file_path: Path to file
+            mutable: Return the cached result itself instead of a copy,
+                so changes to it are seen by later calls
+            output: 'pandas' for DataFrame row data, or 'arrow' for a
+                pyarrow.Table that Arrow-native tools read without
+                further conversion (requires pyarrow)
             
         Returns:
             Parsed and standardized data
         """
-        parser = ParserFactory.get_parser(file_path)
-        return parser.parse(file_path)
\ No newline at end of file
+        if output not in ('pandas', 'arrow'):
+            raise ValueError(f"Unsupported output: {output}")
+        
+        # Unsupported formats fail before the file is parsed
+        ParserFactory.get_parser(file_path)
+        
+        stat = os.stat(file_path)
+        result = _parse_cached(
+            os.path.abspath(file_path), 
+            stat.st_mtime_ns, 
+            stat.st_size, 
+            _parser_precision()
+        )
+        if not mutable:
+            result = _detached(result)
+        if output == 'arrow':
+            return _to_arrow(result)
+        return result
+    
+    @staticmethod
+    def parse_many(
+        file_paths: List[str], 
+        max_workers: Optional[int] = None, 
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Parse many files on a pool of worker processes
+        
+        Each worker imports the parsing libraries and creates its parsers
+        once, then reuses them for every file it is given. Workers are
+        started from a forkserver where the platform supports it, and
+        spawned otherwise.
+        
+        Args:
+            file_paths: Paths of the files to parse
+            max_workers: Number of worker processes (default: CPU count)
+            return_exceptions: Return a failed file's exception in its
+                place instead of raising it
+            
+        Returns:
+            Parsed data for each file, in input order
+        """
+        if len(file_paths) <= 1:
+            return [
+                _parse_in_worker(path, return_exceptions, mutable=False) 
+                for path in file_paths
+            ]
+        
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_worker_context()) as executor:
+            return list(executor.map(
+                _parse_in_worker, 
+                file_paths, 
+                repeat(return_exceptions), 
+                chunksize=chunksize
+            ))
\ No newline at end of file
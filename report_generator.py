@@ -3,7 +3,7 @@ PDF Report Generator
 Creates comprehensive financial analysis reports
 """
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.platypus import (
@@ -14,64 +14,316 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
+import copy
+import hashlib
 import io
+import json
 import os
+import textwrap
+import threading
+from types import SimpleNamespace
+from xml.sax.saxutils import escape
 
+from config import get_config
 
-class ReportGenerator:
-    """Generate comprehensive PDF financial reports"""
-    
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+# Number of rendered reports kept for reuse by identical generate() calls
+_PDF_CACHE_SIZE = 32
+
+# Rendered PDF bytes keyed by a digest of the results and report date,
+# shared by all generators (the coordinator creates one per report)
+_pdf_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+
+# Fixed table row heights in points: a 12pt bold header with 12pt bottom
+# padding, and single-line body rows. Fixed heights spare reportlab from
+# measuring every cell during layout.
+_HEADER_ROW_HEIGHT = 27
+_ROW_HEIGHT = 0.25 * inch
+
+# Rows of the key metrics table: metric key, label and value formatter
+_METRIC_ROWS = (
+    ('total_revenue', 'Total Revenue', '${:,.2f}'.format),
+    ('profit_margin', 'Profit Margin', '{:.2f}%'.format),
+    ('revenue_growth', 'Revenue Growth', '{:.2f}%'.format),
+    ('total_profit', 'Total Profit', '${:,.2f}'.format),
+    ('expense_ratio', 'Expense Ratio', '{:.2f}%'.format)
+)
+
+# Currency metrics charted under the metrics table, with their labels
+_CHART_METRICS = (('total_revenue', 'Revenue'), ('total_profit', 'Profit'))
+
+# Agent result keys and the names they are credited under in the appendix
+_AGENT_NAMES = (
+    ('data_analysis', 'Data Analysis Agent'),
+    ('risk_evaluation', 'Risk Evaluation Agent'),
+    ('market_strategy', 'Market Strategy Agent')
+)
+
+# Longest action text shown in the action-plan table
+_ACTION_WIDTH = 50
+
+_METRICS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_RISK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e74c3c')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lavender),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_ACTION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#27ae60')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+
+@lru_cache(maxsize=1)
+def _build_styles() -> StyleSheet1:
+    """Sample stylesheet extended with the report's custom styles, built once"""
+    styles = getSampleStyleSheet()
     
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
+    custom_styles = [
         # Title style
-        self.styles.add(ParagraphStyle(
+        ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
             textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=30,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
-        ))
-        
+        ),
         # Section header style
-        self.styles.add(ParagraphStyle(
+        ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
             textColor=colors.HexColor('#2c3e50'),
             spaceBefore=20,
             spaceAfter=12,
             fontName='Helvetica-Bold'
-        ))
-        
+        ),
         # Subsection style
-        self.styles.add(ParagraphStyle(
+        ParagraphStyle(
             name='SubSection',
-            parent=self.styles['Heading3'],
+            parent=styles['Heading3'],
             fontSize=12,
             textColor=colors.HexColor('#34495e'),
             spaceBefore=12,
             spaceAfter=6,
             fontName='Helvetica-Bold'
-        ))
-        
+        ),
         # Body text
-        self.styles.add(ParagraphStyle(
+        ParagraphStyle(
             name='BodyText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             textColor=colors.HexColor('#4a4a4a'),
             alignment=TA_JUSTIFY,
             spaceAfter=10
-        ))
+        ),
+        # Cover page footnote
+        ParagraphStyle(
+            name='Subtitle',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        )
+    ]
+    
+    for style in custom_styles:
+        if style.name in styles:
+            # The sample sheet already defines BodyText; ours replaces it
+            styles.byName[style.name] = style
+        else:
+            styles.add(style)
+    
+    return styles
+
+
+@lru_cache(maxsize=None)
+def _parsed_paragraph(text: str, style_name: str) -> Paragraph:
+    """Paragraph of fixed report text, parsed once per process"""
+    return Paragraph(text, _build_styles()[style_name])
+
+
+def _static_paragraph(text: str, style_name: str) -> Paragraph:
+    """
+    Fresh Paragraph for fixed report text
+    
+    Copies share the parsed text of one cached Paragraph but are laid out
+    independently, so each report can use its own.
+    """
+    return copy.copy(_parsed_paragraph(text, style_name))
+
+
+def _make_bar_chart(values: Sequence[float], labels: Sequence[str]) -> Drawing:
+    """Vector bar chart of values, one labelled bar per value"""
+    drawing = Drawing(400, 200)
+    drawing.hAlign = 'CENTER'
+    
+    chart = VerticalBarChart()
+    chart.x = 70
+    chart.y = 30
+    chart.width = 310
+    chart.height = 150
+    chart.data = [list(values)]
+    chart.categoryAxis.categoryNames = list(labels)
+    chart.valueAxis.valueMin = min(0, *values)
+    chart.valueAxis.labelTextFormat = lambda value: f"${value:,.0f}"
+    for axis in (chart.categoryAxis, chart.valueAxis):
+        axis.labels.fontName = 'Helvetica'
+        axis.labels.fontSize = 8
+    chart.bars[0].fillColor = colors.HexColor('#34495e')
+    
+    drawing.add(chart)
+    return drawing
+
+
+def _risk_factor_columns(risk_factors: Dict[str, Dict[str, Any]]) -> SimpleNamespace:
+    """Risk factors as parallel columns of display categories, levels and scores"""
+    return SimpleNamespace(
+        categories=[risk_type.replace('_', ' ').title() for risk_type in risk_factors],
+        levels=[risk_data.get('level', 'Medium') for risk_data in risk_factors.values()],
+        scores=[str(risk_data.get('score', 50)) for risk_data in risk_factors.values()]
+    )
+
+
+def _short_action(text: str) -> str:
+    """
+    Action text cut to _ACTION_WIDTH characters at a word boundary
+    
+    Text with no space early enough to break at (a long identifier or
+    URL) is cut mid-word instead of being reduced to the placeholder.
+    """
+    shortened = textwrap.shorten(text, width=_ACTION_WIDTH, placeholder='...')
+    if shortened == '...' and text.strip():
+        return text[:_ACTION_WIDTH] + '...'
+    return shortened
+
+
+def _action_plan_columns(action_plan: List[Dict[str, Any]]) -> SimpleNamespace:
+    """Action plan entries as parallel columns of the action-table cells"""
+    return SimpleNamespace(
+        numbers=[str(action.get('action_number', '')) for action in action_plan],
+        actions=[
+            _short_action(action.get('action', '')) for action in action_plan
+        ],
+        timelines=[action.get('timeline', '') for action in action_plan],
+        priorities=[
+            'High' if action.get('action_number', 0) <= 2 else 'Medium'
+            for action in action_plan
+        ]
+    )
+
+
+class _ReportView(NamedTuple):
+    """The parts of the analysis results a report reads, defaults filled in"""
+    metrics: Dict[str, Any]
+    insights: List[Any]
+    trends: Dict[str, Any]
+    risk_level: str
+    risk_factors: Dict[str, Dict[str, Any]]
+    mitigation: List[Any]
+    position: Dict[str, Any]
+    opportunities: List[Dict[str, Any]]
+    recommendations: List[Dict[str, Any]]
+    action_plan: List[Dict[str, Any]]
+    consensus: Dict[str, Any]
+    key_points: Tuple[Tuple[str, List[Any]], ...]
+
+
+def _dig(mapping: Any, *keys: Any, default: Any = None) -> Any:
+    """
+    Value at a path of keys into nested mappings, or default if any is missing
+    
+    Avoids the throwaway dicts of chained .get(key, {}) calls; a level that
+    is not a mapping also yields the default.
+    """
+    try:
+        for key in keys:
+            mapping = mapping[key]
+        return mapping
+    except (KeyError, TypeError, IndexError):
+        return default
+
+
+def _report_view(results: Dict[str, Any]) -> _ReportView:
+    """Walk the nested analysis results once and collect what the report shows"""
+    return _ReportView(
+        metrics=_dig(results, 'data_analysis', 'metrics', default={}),
+        insights=_dig(results, 'data_analysis', 'insights', default=[]),
+        trends=_dig(results, 'data_analysis', 'trends', default={}),
+        risk_level=_dig(results, 'risk_evaluation', 'overall_risk', default='Medium'),
+        risk_factors=_dig(results, 'risk_evaluation', 'risk_factors', default={}),
+        mitigation=_dig(results, 'risk_evaluation', 'mitigation_strategies', default=[]),
+        position=_dig(results, 'market_strategy', 'strategic_position', default={}),
+        opportunities=_dig(results, 'market_strategy', 'opportunities', default=[]),
+        recommendations=_dig(results, 'market_strategy', 'recommendations', default=[]),
+        action_plan=_dig(results, 'market_strategy', 'action_plan', default=[]),
+        consensus=results.get('consensus', {}),
+        key_points=tuple(
+            (agent_name, _dig(results, agent_key, 'key_points', default=[]))
+            for agent_key, agent_name in _AGENT_NAMES if agent_key in results
+        )
+    )
+
+
+def _report_key(analysis_results: Dict[str, Any], report_date: str) -> str:
+    """Digest identifying a report by its input results and cover date"""
+    payload = json.dumps(analysis_results, sort_keys=True, default=str)
+    return hashlib.blake2b(
+        f"{report_date}\n{payload}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _cached_pdf(key: str) -> Optional[bytes]:
+    """Previously rendered PDF for a report key, if still cached"""
+    with _pdf_cache_lock:
+        pdf = _pdf_cache.get(key)
+        if pdf is not None:
+            _pdf_cache.move_to_end(key)
+        return pdf
+
+
+def _store_pdf(key: str, pdf: bytes) -> None:
+    """Remember a rendered PDF, evicting the least recently used one"""
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf
+        _pdf_cache.move_to_end(key)
+        if len(_pdf_cache) > _PDF_CACHE_SIZE:
+            _pdf_cache.popitem(last=False)
+
+
+class ReportGenerator:
+    """Generate comprehensive PDF financial reports"""
+    
+    def __init__(self):
+        # Shared, prebuilt stylesheet; treat it as read-only
+        self.styles = _build_styles()
     
     def generate(
         self, 
@@ -81,6 +333,9 @@ class ReportGenerator:
         """
         Generate comprehensive PDF report
         
+        A report already rendered today from identical results is written
+        out again without rebuilding it.
+        
         Args:
             analysis_results: Results from all agents
             output_path: Output PDF file path
@@ -88,9 +343,19 @@ class ReportGenerator:
         Returns:
             Path to generated PDF
         """
-        # Create PDF document
+        report_date = datetime.now().strftime('%B %d, %Y')
+        key = _report_key(analysis_results, report_date)
+        
+        pdf = _cached_pdf(key)
+        if pdf is not None:
+            with open(output_path, 'wb') as f:
+                f.write(pdf)
+            return output_path
+        
+        # Create PDF document, rendered in memory so it can be cached
+        buffer = io.BytesIO()
         doc = SimpleDocTemplate(
-            output_path,
+            buffer,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
@@ -98,85 +363,75 @@ class ReportGenerator:
             bottomMargin=18
         )
         
-        # Build story (content)
+        view = _report_view(analysis_results)
+        
+        sections = [
+            # Cover page
+            self._create_cover_page(report_date),
+            # Executive summary
+            self._create_executive_summary(view),
+            # Data analysis section
+            self._create_data_analysis_section(view),
+            # Risk assessment section
+            self._create_risk_section(view),
+            # Strategic recommendations
+            self._create_strategy_section(view),
+            # Appendix
+            self._create_appendix(view)
+        ]
+        
+        # Build story (content), one page break between non-empty sections
         story = []
-        
-        # Cover page
-        story.extend(self._create_cover_page())
-        story.append(PageBreak())
-        
-        # Executive summary
-        story.extend(self._create_executive_summary(analysis_results))
-        story.append(PageBreak())
-        
-        # Data analysis section
-        story.extend(self._create_data_analysis_section(analysis_results))
-        story.append(PageBreak())
-        
-        # Risk assessment section
-        story.extend(self._create_risk_section(analysis_results))
-        story.append(PageBreak())
-        
-        # Strategic recommendations
-        story.extend(self._create_strategy_section(analysis_results))
-        story.append(PageBreak())
-        
-        # Appendix
-        story.extend(self._create_appendix(analysis_results))
+        for section in sections:
+            if not section:
+                continue
+            if story:
+                story.append(PageBreak())
+            story.extend(section)
         
         # Build PDF
         doc.build(story)
+        pdf = buffer.getvalue()
+        
+        with open(output_path, 'wb') as f:
+            f.write(pdf)
+        _store_pdf(key, pdf)
         
         return output_path
     
-    def _create_cover_page(self) -> List:
-        """Create report cover page"""
+    def _create_cover_page(self, report_date: str) -> List:
+        """Create report cover page dated report_date"""
         story = []
         
         # Title
         story.append(Spacer(1, 2*inch))
-        story.append(Paragraph(
-            "FINANCIAL ANALYSIS REPORT",
-            self.styles['CustomTitle']
-        ))
+        story.append(_static_paragraph("FINANCIAL ANALYSIS REPORT", 'CustomTitle'))
         
         story.append(Spacer(1, 0.5*inch))
         
         # Subtitle
-        story.append(Paragraph(
-            "Multi-Agent Financial Intelligence System",
-            self.styles['Normal']
-        ))
+        story.append(_static_paragraph("Multi-Agent Financial Intelligence System", 'Normal'))
         
         story.append(Spacer(1, 1*inch))
         
         # Date
         story.append(Paragraph(
-            f"Generated: {datetime.now().strftime('%B %d, %Y')}",
+            f"Generated: {report_date}",
             self.styles['Normal']
         ))
         
         story.append(Spacer(1, 0.5*inch))
         
         # Powered by
-        story.append(Paragraph(
-            "Powered by Agno Multi-Agent Framework",
-            ParagraphStyle(
-                name='Subtitle',
-                parent=self.styles['Normal'],
-                fontSize=10,
-                textColor=colors.grey,
-                alignment=TA_CENTER
-            )
-        ))
+        story.append(_static_paragraph("Powered by Agno Multi-Agent Framework", 'Subtitle'))
         
         return story
     
-    def _create_executive_summary(self, results: Dict[str, Any]) -> List:
+    def _create_executive_summary(self, view: _ReportView) -> List:
         """Create executive summary section"""
         story = []
         
-        story.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        story.append(_static_paragraph("Executive Summary", 'SectionHeader'))
         story.append(Spacer(1, 12))
         
         # Overview paragraph
@@ -186,38 +441,42 @@ class ReportGenerator:
         Risk Evaluation, and Market Strategy—have collaboratively analyzed the 
         provided financial data to deliver actionable insights.
         """
-        story.append(Paragraph(overview_text, self.styles['BodyText']))
+        story.append(_static_paragraph(overview_text, 'BodyText'))
         story.append(Spacer(1, 12))
         
         # Key findings
-        story.append(Paragraph("Key Findings:", self.styles['SubSection']))
+        story.append(_static_paragraph("Key Findings:", 'SubSection'))
         
-        key_findings = self._extract_key_findings(results)
-        for finding in key_findings:
-            story.append(Paragraph(f"• {finding}", self.styles['BodyText']))
+        key_findings = self._extract_key_findings(view)
+        story.append(Paragraph(
+            "<br/>".join(f"• {escape(finding)}" for finding in key_findings),
+            self.styles['BodyText']
+        ))
         
         story.append(Spacer(1, 12))
         
         # Overall assessment
-        consensus = results.get('consensus', {})
         assessment = f"""
         <b>Overall Assessment:</b> Based on the collaborative analysis of all agents, 
-        the financial position demonstrates {self._get_overall_sentiment(results)} 
-        characteristics with {consensus.get('confidence_level', 'Medium')} confidence.
+        the financial position demonstrates {self._get_overall_sentiment(view)} 
+        characteristics with {view.consensus.get('confidence_level', 'Medium')} confidence.
         """
         story.append(Paragraph(assessment, self.styles['BodyText']))
         
-        return story
+        # Fits on one page; keeping it together spares reportlab a split pass
+        return [KeepTogether(story)]
     
-    def _create_data_analysis_section(self, results: Dict[str, Any]) -> List:
-        """Create data analysis section"""
+    def _create_data_analysis_section(self, view: _ReportView) -> List:
+        """Create data analysis section, or nothing when there is no data to show"""
+        if not (view.metrics or view.insights or view.trends):
+            return []
+        
         story = []
         
         story.append(Paragraph("Financial Data Analysis", self.styles['SectionHeader']))
         story.append(Spacer(1, 12))
         
-        data_analysis = results.get('data_analysis', {})
-        metrics = data_analysis.get('metrics', {})
+        metrics = view.metrics
         
         # Metrics table
         if metrics:
@@ -225,69 +484,62 @@ class ReportGenerator:
             
             # Create table data
             table_data = [['Metric', 'Value']]
-            
-            metric_display = {
-                'total_revenue': ('Total Revenue', '$'),
-                'profit_margin': ('Profit Margin', '%'),
-                'revenue_growth': ('Revenue Growth', '%'),
-                'total_profit': ('Total Profit', '$'),
-                'expense_ratio': ('Expense Ratio', '%')
-            }
-            
-            for key, (label, unit) in metric_display.items():
-                if key in metrics:
-                    value = metrics[key]
-                    if unit == '$':
-                        formatted_value = f"${value:,.2f}"
-                    else:
-                        formatted_value = f"{value:.2f}{unit}"
-                    table_data.append([label, formatted_value])
+            table_data.extend(
+                [label, fmt(metrics[key])]
+                for key, label, fmt in _METRIC_ROWS if key in metrics
+            )
             
             # Create table
-            table = Table(table_data, colWidths=[3*inch, 2*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            table = Table(
+                table_data, 
+                colWidths=[3*inch, 2*inch],
+                rowHeights=[_HEADER_ROW_HEIGHT] + [_ROW_HEIGHT] * (len(table_data) - 1),
+                repeatRows=1
+            )
+            table.setStyle(_METRICS_TABLE_STYLE)
             
             story.append(table)
             story.append(Spacer(1, 12))
+            
+            # Chart of the currency metrics
+            charted = [(metrics[key], label) for key, label in _CHART_METRICS if key in metrics]
+            if charted and get_config()['report']['include_charts']:
+                values, labels = zip(*charted)
+                story.append(_make_bar_chart(values, labels))
+                story.append(Spacer(1, 12))
         
         # Insights
-        insights = data_analysis.get('insights', [])
+        insights = view.insights
         if insights:
             story.append(Paragraph("Key Insights:", self.styles['SubSection']))
-            for insight in insights:
-                story.append(Paragraph(f"• {insight}", self.styles['BodyText']))
+            story.append(Paragraph(
+                "<br/>".join(f"• {escape(str(insight))}" for insight in insights),
+                self.styles['BodyText']
+            ))
             story.append(Spacer(1, 12))
         
         # Trends
-        trends = data_analysis.get('trends', {})
+        trends = view.trends
         if trends:
             story.append(Paragraph("Observed Trends:", self.styles['SubSection']))
-            for metric, trend in trends.items():
-                story.append(Paragraph(
-                    f"• <b>{metric.title()}:</b> {trend}",
-                    self.styles['BodyText']
-                ))
+            story.append(Paragraph(
+                "<br/>".join(
+                    f"• <b>{escape(metric.title())}:</b> {escape(str(trend))}"
+                    for metric, trend in trends.items()
+                ),
+                self.styles['BodyText']
+            ))
         
         return story
     
-    def _create_risk_section(self, results: Dict[str, Any]) -> List:
+    def _create_risk_section(self, view: _ReportView) -> List:
         """Create risk assessment section"""
         story = []
         
         story.append(Paragraph("Risk Assessment", self.styles['SectionHeader']))
         story.append(Spacer(1, 12))
         
-        risk_eval = results.get('risk_evaluation', {})
-        overall_risk = risk_eval.get('overall_risk', 'Medium')
+        overall_risk = view.risk_level
         
         # Overall risk summary
         risk_text = f"""
@@ -299,51 +551,46 @@ class ReportGenerator:
         story.append(Spacer(1, 12))
         
         # Risk factors table
-        risk_factors = risk_eval.get('risk_factors', {})
+        risk_factors = view.risk_factors
         if risk_factors:
             story.append(Paragraph("Risk Factor Breakdown", self.styles['SubSection']))
             
+            columns = _risk_factor_columns(risk_factors)
             table_data = [['Risk Category', 'Level', 'Score']]
+            table_data.extend(map(list, zip(columns.categories, columns.levels, columns.scores)))
             
-            for risk_type, risk_data in risk_factors.items():
-                category = risk_type.replace('_', ' ').title()
-                level = risk_data.get('level', 'Medium')
-                score = risk_data.get('score', 50)
-                table_data.append([category, level, str(score)])
-            
-            table = Table(table_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e74c3c')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lavender),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            table = Table(
+                table_data, 
+                colWidths=[2.5*inch, 1.5*inch, 1.5*inch],
+                rowHeights=[_HEADER_ROW_HEIGHT] + [_ROW_HEIGHT] * (len(table_data) - 1),
+                repeatRows=1
+            )
+            table.setStyle(_RISK_TABLE_STYLE)
             
             story.append(table)
             story.append(Spacer(1, 12))
         
         # Mitigation strategies
-        strategies = risk_eval.get('mitigation_strategies', [])
+        strategies = view.mitigation
         if strategies:
             story.append(Paragraph("Risk Mitigation Strategies:", self.styles['SubSection']))
-            for i, strategy in enumerate(strategies, 1):
-                story.append(Paragraph(f"{i}. {strategy}", self.styles['BodyText']))
+            story.append(Paragraph(
+                "<br/>".join(
+                    f"{i}. {escape(str(strategy))}" for i, strategy in enumerate(strategies, 1)
+                ),
+                self.styles['BodyText']
+            ))
         
         return story
     
-    def _create_strategy_section(self, results: Dict[str, Any]) -> List:
+    def _create_strategy_section(self, view: _ReportView) -> List:
         """Create strategic recommendations section"""
         story = []
         
         story.append(Paragraph("Strategic Recommendations", self.styles['SectionHeader']))
         story.append(Spacer(1, 12))
         
-        strategy = results.get('market_strategy', {})
-        position = strategy.get('strategic_position', {})
+        position = view.position
         
         # Strategic position
         story.append(Paragraph("Strategic Position", self.styles['SubSection']))
@@ -355,106 +602,103 @@ class ReportGenerator:
         story.append(Spacer(1, 12))
         
         # Opportunities
-        opportunities = strategy.get('opportunities', [])
+        opportunities = view.opportunities
         if opportunities:
             story.append(Paragraph("Strategic Opportunities:", self.styles['SubSection']))
-            for opp in opportunities[:3]:  # Top 3
-                story.append(Paragraph(
-                    f"<b>{opp.get('type', 'Opportunity')}</b>: {opp.get('description', '')}",
-                    self.styles['BodyText']
-                ))
+            story.append(Paragraph(
+                "<br/>".join(
+                    f"<b>{escape(str(opp.get('type', 'Opportunity')))}</b>: "
+                    f"{escape(str(opp.get('description', '')))}"
+                    for opp in opportunities[:3]  # Top 3
+                ),
+                self.styles['BodyText']
+            ))
             story.append(Spacer(1, 12))
         
         # Recommendations
-        recommendations = strategy.get('recommendations', [])
+        recommendations = view.recommendations
         if recommendations:
             story.append(Paragraph("Priority Recommendations:", self.styles['SubSection']))
-            for i, rec in enumerate(recommendations[:5], 1):
-                rec_text = f"""
-                <b>{i}. {rec.get('category', 'Strategy')}</b><br/>
-                {rec.get('recommendation', '')}<br/>
-                <i>Expected Outcome: {rec.get('expected_outcome', 'N/A')}</i>
-                """
-                story.append(Paragraph(rec_text, self.styles['BodyText']))
-                story.append(Spacer(1, 6))
+            # One paragraph for all recommendations, a blank line apart
+            story.append(Paragraph(
+                "<br/><br/>".join(
+                    f"<b>{i}. {escape(str(rec.get('category', 'Strategy')))}</b><br/>"
+                    f"{escape(str(rec.get('recommendation', '')))}<br/>"
+                    f"<i>Expected Outcome: {escape(str(rec.get('expected_outcome', 'N/A')))}</i>"
+                    for i, rec in enumerate(recommendations[:5], 1)
+                ),
+                self.styles['BodyText']
+            ))
         
         # Action plan
-        action_plan = strategy.get('action_plan', [])
+        action_plan = view.action_plan
         if action_plan:
             story.append(Paragraph("Action Plan:", self.styles['SubSection']))
             
+            columns = _action_plan_columns(action_plan[:5])
             table_data = [['#', 'Action', 'Timeline', 'Priority']]
-            for action in action_plan[:5]:
-                table_data.append([
-                    str(action.get('action_number', '')),
-                    action.get('action', '')[:50] + '...',
-                    action.get('timeline', ''),
-                    'High' if action.get('action_number', 0) <= 2 else 'Medium'
-                ])
+            table_data.extend(map(list, zip(
+                columns.numbers, columns.actions, columns.timelines, columns.priorities
+            )))
             
-            table = Table(table_data, colWidths=[0.5*inch, 3*inch, 1.5*inch, 1*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#27ae60')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            table = Table(
+                table_data, 
+                colWidths=[0.5*inch, 3*inch, 1.5*inch, 1*inch],
+                rowHeights=[_ROW_HEIGHT] * len(table_data),
+                repeatRows=1
+            )
+            table.setStyle(_ACTION_TABLE_STYLE)
             
             story.append(table)
         
         return story
     
-    def _create_appendix(self, results: Dict[str, Any]) -> List:
+    def _create_appendix(self, view: _ReportView) -> List:
         """Create appendix section"""
         story = []
         
-        story.append(Paragraph("Appendix", self.styles['SectionHeader']))
+        story.append(_static_paragraph("Appendix", 'SectionHeader'))
         story.append(Spacer(1, 12))
         
         # Methodology
-        story.append(Paragraph("Methodology", self.styles['SubSection']))
+        story.append(_static_paragraph("Methodology", 'SubSection'))
         methodology_text = """
         This analysis was conducted using a multi-agent AI system powered by the 
         Agno framework. Three specialized agents—Data Analysis, Risk Evaluation, 
         and Market Strategy—collaborated to provide comprehensive insights from 
         different analytical perspectives.
         """
-        story.append(Paragraph(methodology_text, self.styles['BodyText']))
+        story.append(_static_paragraph(methodology_text, 'BodyText'))
         story.append(Spacer(1, 12))
         
         # Agent contributions
-        story.append(Paragraph("Agent Contributions:", self.styles['SubSection']))
-        agents = ['data_analysis', 'risk_evaluation', 'market_strategy']
-        agent_names = ['Data Analysis Agent', 'Risk Evaluation Agent', 'Market Strategy Agent']
-        
-        for agent_key, agent_name in zip(agents, agent_names):
-            if agent_key in results:
-                key_points = results[agent_key].get('key_points', [])
-                if key_points:
-                    story.append(Paragraph(f"<b>{agent_name}:</b>", self.styles['BodyText']))
-                    for point in key_points[:3]:
-                        story.append(Paragraph(f"  • {point}", self.styles['BodyText']))
+        story.append(_static_paragraph("Agent Contributions:", 'SubSection'))
+        for agent_name, key_points in view.key_points:
+            if key_points:
+                story.append(Paragraph(
+                    "<br/>".join([f"<b>{agent_name}:</b>"] + [
+                        f"  • {escape(str(point))}" for point in key_points[:3]
+                    ]),
+                    self.styles['BodyText']
+                ))
         
-        return story
+        # The appendix is short; lay it out as one unsplit block
+        return [KeepTogether(story)]
     
-    def _extract_key_findings(self, results: Dict[str, Any]) -> List[str]:
+    def _extract_key_findings(self, view: _ReportView) -> List[str]:
         """Extract key findings from all agents"""
         findings = []
         
         # From data analysis
-        data_metrics = results.get('data_analysis', {}).get('metrics', {})
-        if 'revenue_growth' in data_metrics:
-            growth = data_metrics['revenue_growth']
+        if 'revenue_growth' in view.metrics:
+            growth = view.metrics['revenue_growth']
             findings.append(f"Revenue growth of {growth:.1f}% observed")
         
         # From risk evaluation
-        risk_level = results.get('risk_evaluation', {}).get('overall_risk', 'Medium')
-        findings.append(f"Overall risk level assessed as {risk_level}")
+        findings.append(f"Overall risk level assessed as {view.risk_level}")
         
         # From strategy
-        position = results.get('market_strategy', {}).get('strategic_position', {})
+        position = view.position
         findings.append(
             f"Strategic position: {position.get('strength', 'Medium')} strength with "
             f"{position.get('growth_potential', 'Medium')} growth potential"
@@ -462,10 +706,10 @@ class ReportGenerator:
         
         return findings
     
-    def _get_overall_sentiment(self, results: Dict[str, Any]) -> str:
+    def _get_overall_sentiment(self, view: _ReportView) -> str:
         """Determine overall sentiment from analysis"""
-        risk_level = results.get('risk_evaluation', {}).get('overall_risk', 'Medium')
-        growth = results.get('data_analysis', {}).get('metrics', {}).get('revenue_growth', 0)
+        risk_level = view.risk_level
+        growth = view.metrics.get('revenue_growth', 0)
         
         if risk_level == 'Low' and growth > 10:
             return "strong positive"
@@ -1,12 +1,200 @@
 """
 Risk Evaluation Agent - Specializes in financial risk assessment and mitigation strategies
 """
-from typing import Dict, List, Any
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Any, Hashable, NamedTuple, Optional, Tuple
+import copy
+import hashlib
+import logging
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from agno import Agent
 
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Number of evaluation results each agent keeps for repeated inputs
+_RESULT_CACHE_SIZE = 128
+
+
+# Stand-in data evaluated when no DataFrame was parsed. Shared by every
+# evaluation, so it must never be mutated.
+_SAMPLE_DATA = pd.DataFrame({
+    'revenue': [100000, 120000, 150000, 180000],
+    'expenses': [75000, 85000, 95000, 110000],
+    'assets': [500000, 520000, 550000, 580000],
+    'liabilities': [200000, 210000, 220000, 230000]
+})
+
+# Columns the risk assessment reads
+_RISK_COLUMNS = frozenset((
+    'revenue', 'expenses', 'assets', 'liabilities',
+    'current_assets', 'current_liabilities', 'profit'
+))
+
+# Level and score of each bucket, in the order of the threshold edges.
+# Liquidity is inverted: a higher current ratio means lower risk.
+_VOLATILITY_BUCKETS = (("Low", "Medium", "High"), (30, 50, 80))
+_DEBT_RATIO_BUCKETS = (("Low", "Medium", "High"), (20, 50, 85))
+_LIQUIDITY_BUCKETS = (("High", "Medium", "Low"), (80, 50, 25))
+
+# Mitigation strategy for each risk category rated Medium or High
+_MITIGATION_STRATEGIES = {
+    'market_risk': "Diversify revenue streams to reduce market volatility exposure",
+    'credit_risk': "Implement debt reduction plan and improve credit management",
+    'liquidity_risk': "Increase cash reserves and optimize working capital management",
+    'operational_risk': "Implement cost control measures and improve operational efficiency"
+}
+_MITIGATED_LEVELS = frozenset(('High', 'Medium'))
+
+# Overall level by average category score: below 40 Low, below 65 Medium
+_OVERALL_RISK_LEVELS = ("Low", "Medium", "High")
+_OVERALL_RISK_EDGES = np.array([40, 65])
+
+
+class _RiskInputs(NamedTuple):
+    """
+    Figures the risk assessors read, computed once per evaluation
+    
+    A field is None when the columns it needs are missing. A field whose
+    cells include one that is not a number is listed in failed with the
+    error to report, so only the category reading it fails.
+    """
+    volatility: Optional[float]
+    latest_debt: Optional[float]
+    latest_assets: Optional[float]
+    current_ratio: Optional[float]
+    recent_losses: Optional[bool]
+    expense_growth: Optional[float]
+    failed: Dict[str, Exception]
+    
+    def raise_failed(self, field: str) -> None:
+        """Raise the error recorded for a field, if any"""
+        if field in self.failed:
+            raise self.failed[field]
+
+
+class _RiskThresholds(NamedTuple):
+    """Thresholds for volatility (%), debt-to-asset ratio (%) and current ratio"""
+    vol_low: float
+    vol_medium: float
+    vol_high: float
+    debt_low: float
+    debt_medium: float
+    debt_high: float
+    liquidity_low: float
+    liquidity_medium: float
+    liquidity_high: float
+
+
+class _MetricsView(NamedTuple):
+    """The data analysis metrics the assessors read, defaults filled in"""
+    profit_margin: float
+    revenue_growth: float
+
+
+# Inputs for a frame with no rows or none of _RISK_COLUMNS
+_NO_RISK_INPUTS = _RiskInputs(
+    volatility=None,
+    latest_debt=None,
+    latest_assets=None,
+    current_ratio=None,
+    recent_losses=None,
+    expense_growth=None,
+    failed={}
+)
+
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    """
+    A column as a float ndarray, missing values as NaN
+    
+    float32 columns (parsed with PARSER_PRECISION=fp32) are read as they
+    are, without a widening copy; everything else is read as float64.
+    """
+    column = df[name]
+    dtype = np.float32 if column.dtype == np.float32 else np.float64
+    return column.to_numpy(dtype=dtype, na_value=np.nan)
+
+
+def _read_column(
+    df: pd.DataFrame, 
+    name: str
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    A column as a float ndarray, plus a mask of cells that are not numbers
+    
+    The mask is None when every cell reads as a number. Otherwise the
+    offending cells read as NaN.
+    """
+    try:
+        return _column(df, name), None
+    except (TypeError, ValueError):
+        column = df[name]
+        try:
+            numbers = pd.to_numeric(column, errors='coerce')
+        except TypeError:
+            # Cells pandas cannot even coerce, such as lists
+            numbers = pd.Series(np.nan, index=column.index)
+        unreadable = numbers.isna().to_numpy() & column.notna().to_numpy()
+        return numbers.to_numpy(dtype=np.float64, na_value=np.nan), unreadable
+
+
+def _growth_rate(values: np.ndarray) -> float:
+    """Percent change from the first to the last value"""
+    if values.size < 2:
+        return 0.0
+    first_value = float(values[0])
+    if first_value == 0:
+        return 0.0
+    return ((float(values[-1]) - first_value) / first_value) * 100
+
+
+def _volatility(values: np.ndarray) -> np.float64:
+    """
+    Coefficient of variation in percent
+    
+    Sample std over mean of the non-missing values, as pandas computes them.
+    NaN when fewer than two values are present.
+    """
+    values = values[~np.isnan(values)]
+    if values.size < 2:
+        return np.float64(np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (values.std(ddof=1) / values.mean()) * 100
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """Digest of a DataFrame's column names and contents"""
+    digest = hashlib.blake2b(repr(tuple(df.columns)).encode(), digest_size=16)
+    digest.update(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    )
+    return digest.hexdigest()
+
+
+def _classify(
+    value: float, 
+    edges: np.ndarray, 
+    buckets: Tuple[Tuple[str, ...], Tuple[int, ...]]
+) -> Tuple[str, int]:
+    """
+    Level and score of the bucket value falls in
+    
+    edges are sorted; a value equal to an edge falls in the upper bucket.
+    NaN compares false against every threshold, so it lands in the middle
+    bucket.
+    """
+    levels, scores = buckets
+    if np.isnan(value):
+        index = len(levels) // 2
+    else:
+        index = int(np.searchsorted(edges, value, side='right'))
+    return levels[index], scores[index]
+
 
 class RiskEvaluationAgent(Agent):
     """
@@ -22,16 +210,33 @@ class RiskEvaluationAgent(Agent):
             "credit_risk",
             "operational_risk"
         ]
-        self.risk_thresholds = {
-            'volatility': {'low': 5, 'medium': 15, 'high': 25},
-            'debt_ratio': {'low': 30, 'medium': 60, 'high': 80},
-            'liquidity': {'low': 1.0, 'medium': 1.5, 'high': 2.0}
-        }
+        self.risk_thresholds = _RiskThresholds(
+            vol_low=5, vol_medium=15, vol_high=25,
+            debt_low=30, debt_medium=60, debt_high=80,
+            liquidity_low=1.0, liquidity_medium=1.5, liquidity_high=2.0
+        )
+        
+        # Bucket edges for _classify. Values above (not at) the high
+        # volatility and debt thresholds are High, hence the nextafter.
+        thresholds = self.risk_thresholds
+        self._volatility_edges = np.array(
+            [thresholds.vol_low, np.nextafter(thresholds.vol_high, np.inf)]
+        )
+        self._debt_ratio_edges = np.array(
+            [thresholds.debt_low, np.nextafter(thresholds.debt_high, np.inf)]
+        )
+        self._liquidity_edges = np.array(
+            [thresholds.liquidity_low, thresholds.liquidity_high]
+        )
+        
+        # Results of earlier evaluations, least recently used first
+        self._result_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
     
     async def evaluate(
         self, 
         data: Dict[str, Any], 
-        data_analysis: Dict[str, Any]
+        data_analysis: Dict[str, Any],
+        run_timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Perform comprehensive risk evaluation
@@ -39,15 +244,16 @@ class RiskEvaluationAgent(Agent):
         Args:
             data: Raw financial data
             data_analysis: Results from data analysis agent
+            run_timestamp: Timestamp of the coordinator run (defaults to now)
             
         Returns:
             Risk assessment with recommendations
         """
-        print(f"  [{self.name}] Starting risk evaluation...")
+        logger.debug("[%s] Starting risk evaluation...", self.name)
         
         evaluation_result = {
             "agent": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": run_timestamp or datetime.now().isoformat(),
             "overall_risk": "Medium",
             "risk_factors": {},
             "risk_scores": {},
@@ -61,19 +267,41 @@ class RiskEvaluationAgent(Agent):
             # Prepare data
             df = self._prepare_dataframe(data)
             metrics = data_analysis.get('metrics', {})
+            metrics = _MetricsView(
+                profit_margin=metrics.get('profit_margin', 0),
+                revenue_growth=metrics.get('revenue_growth', 0)
+            )
+            
+            if len(df) == 0 or _RISK_COLUMNS.isdisjoint(df.columns):
+                # Nothing to reduce or cache; only the metrics drive the assessment
+                key = None
+                inputs = _NO_RISK_INPUTS
+            else:
+                # Identical data and metrics give an identical assessment. The
+                # frame digest and column reductions run in a worker thread so
+                # large frames do not stall the event loop; the assessors
+                # themselves only compare a handful of scalars.
+                key = await asyncio.to_thread(self._cache_key, df, metrics)
+                cached = self._cached_result(key)
+                if cached is not None:
+                    evaluation_result.update(cached)
+                    logger.debug("[%s] ✓ Risk evaluation served from cache", self.name)
+                    return evaluation_result
+                
+                inputs = await asyncio.to_thread(self._precompute, df)
             
             # Assess different risk categories
             evaluation_result["risk_factors"]["market_risk"] = self._assess_market_risk(
-                df, metrics
+                inputs, metrics
             )
             evaluation_result["risk_factors"]["credit_risk"] = self._assess_credit_risk(
-                df, metrics
+                inputs, metrics
             )
             evaluation_result["risk_factors"]["liquidity_risk"] = self._assess_liquidity_risk(
-                df, metrics
+                inputs, metrics
             )
             evaluation_result["risk_factors"]["operational_risk"] = self._assess_operational_risk(
-                df, metrics
+                inputs, metrics
             )
             
             # Calculate overall risk score
@@ -96,32 +324,149 @@ class RiskEvaluationAgent(Agent):
                 evaluation_result
             )
             
-            print(f"  [{self.name}] ✓ Risk evaluation complete")
+            self._store_result(key, evaluation_result)
+            
+            logger.debug("[%s] ✓ Risk evaluation complete", self.name)
             
         except Exception as e:
-            print(f"  [{self.name}] ✗ Error: {str(e)}")
+            logger.error("[%s] ✗ Error: %s", self.name, e)
             evaluation_result["error"] = str(e)
             evaluation_result["confidence"] = "Low"
         
         return evaluation_result
     
     def _prepare_dataframe(self, data: Dict[str, Any]) -> pd.DataFrame:
-        """Convert input data to pandas DataFrame"""
+        """Convert input data to pandas DataFrame (read-only; may be shared)"""
         if isinstance(data.get('parsed_data'), pd.DataFrame):
             return data['parsed_data']
         else:
-            # Create sample DataFrame
-            return pd.DataFrame({
-                'revenue': [100000, 120000, 150000, 180000],
-                'expenses': [75000, 85000, 95000, 110000],
-                'assets': [500000, 520000, 550000, 580000],
-                'liabilities': [200000, 210000, 220000, 230000]
-            })
+            # Fall back to the shared sample DataFrame
+            return _SAMPLE_DATA
     
-    def _assess_market_risk(
+    def _cache_key(
         self, 
         df: pd.DataFrame, 
-        metrics: Dict[str, Any]
+        metrics: _MetricsView
+    ) -> Optional[Hashable]:
+        """Result cache key for an evaluation, None when it should not be cached"""
+        if not get_config()['system']['enable_caching']:
+            return None
+        try:
+            key = (len(df), _frame_digest(df), metrics)
+            hash(key)
+        except TypeError:
+            # Unhashable cell values or metrics
+            return None
+        return key
+    
+    def _cached_result(self, key: Optional[Hashable]) -> Optional[Dict[str, Any]]:
+        """Copy of the assessment fields cached for key, if any"""
+        if key is None:
+            return None
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    def _store_result(
+        self, 
+        key: Optional[Hashable], 
+        evaluation_result: Dict[str, Any]
+    ) -> None:
+        """Remember an assessment, evicting the least recently used one"""
+        if key is None:
+            return
+        self._result_cache[key] = copy.deepcopy({
+            field: value for field, value in evaluation_result.items()
+            if field not in ('agent', 'timestamp')
+        })
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    def _precompute(self, df: pd.DataFrame) -> _RiskInputs:
+        """
+        Read each needed column once and reduce it for the assessors
+        
+        Args:
+            df: Financial data
+            
+        Returns:
+            _RiskInputs for the four _assess_* methods
+        """
+        values = {}
+        unreadable = {}
+        for name in _RISK_COLUMNS.intersection(df.columns):
+            values[name], mask = _read_column(df, name)
+            if mask is not None:
+                unreadable[name] = mask
+        
+        # A field fails only when a cell it reads is not a number: every
+        # revenue cell, the last three profit cells, the first and last
+        # expenses (if there are two), and the last cell of the others
+        failed = {}
+        
+        def check(field: str, name: str, cells: Any) -> None:
+            mask = unreadable.get(name)
+            if field in failed or mask is None or not mask[cells].any():
+                return
+            position = np.arange(mask.size)[cells][mask[cells]][0]
+            failed[field] = ValueError(
+                f"Non-numeric value {df[name].iloc[position]!r} in column '{name}'"
+            )
+        
+        def latest(name: str) -> Optional[float]:
+            column = values.get(name)
+            return column[-1] if column is not None and column.size else None
+        
+        volatility = None
+        if 'revenue' in values and len(df) > 1:
+            volatility = _volatility(values['revenue'])
+            check('volatility', 'revenue', slice(None))
+        
+        latest_debt = latest('liabilities')
+        latest_assets = latest('assets')
+        if latest_debt is None or latest_assets is None:
+            latest_debt = latest_assets = None
+        else:
+            check('debt_ratio', 'liabilities', [-1])
+            check('debt_ratio', 'assets', [-1])
+        
+        current_ratio = None
+        current_assets = latest('current_assets')
+        current_liabilities = latest('current_liabilities')
+        if current_assets is not None and current_liabilities is not None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                current_ratio = current_assets / current_liabilities
+            check('current_ratio', 'current_assets', [-1])
+            check('current_ratio', 'current_liabilities', [-1])
+        
+        recent_losses = None
+        if 'profit' in values:
+            recent_losses = bool((values['profit'][-3:] < 0).any())
+            check('recent_losses', 'profit', slice(-3, None))
+        
+        expense_growth = None
+        if 'expenses' in values:
+            expense_growth = _growth_rate(values['expenses'])
+            if values['expenses'].size > 1:
+                check('expense_growth', 'expenses', [0, -1])
+        
+        return _RiskInputs(
+            volatility=volatility,
+            latest_debt=latest_debt,
+            latest_assets=latest_assets,
+            current_ratio=current_ratio,
+            recent_losses=recent_losses,
+            expense_growth=expense_growth,
+            failed=failed
+        )
+    
+    def _assess_market_risk(
+        self, 
+        inputs: _RiskInputs, 
+        metrics: _MetricsView
     ) -> Dict[str, Any]:
         """Assess market and volatility risk"""
         market_risk = {
@@ -131,24 +476,22 @@ class RiskEvaluationAgent(Agent):
         }
         
         try:
-            # Calculate volatility if revenue data exists
-            if 'revenue' in df.columns and len(df) > 1:
-                volatility = (df['revenue'].std() / df['revenue'].mean()) * 100
+            # Classify volatility if revenue data exists
+            volatility = inputs.volatility
+            if volatility is not None:
+                inputs.raise_failed('volatility')
                 
-                if volatility < self.risk_thresholds['volatility']['low']:
-                    market_risk["level"] = "Low"
-                    market_risk["score"] = 30
-                elif volatility > self.risk_thresholds['volatility']['high']:
-                    market_risk["level"] = "High"
-                    market_risk["score"] = 80
+                market_risk["level"], market_risk["score"] = _classify(
+                    volatility, self._volatility_edges, _VOLATILITY_BUCKETS
+                )
                 
                 market_risk["factors"].append(
                     f"Revenue volatility: {volatility:.2f}%"
                 )
-                market_risk["volatility"] = round(volatility, 2)
+                market_risk["volatility"] = round(float(volatility), 2)
             
             # Check growth stability
-            growth_rate = metrics.get('revenue_growth', 0)
+            growth_rate = metrics.revenue_growth
             if abs(growth_rate) > 30:
                 market_risk["factors"].append(
                     "High growth rate volatility detected"
@@ -162,8 +505,8 @@ class RiskEvaluationAgent(Agent):
     
     def _assess_credit_risk(
         self, 
-        df: pd.DataFrame, 
-        metrics: Dict[str, Any]
+        inputs: _RiskInputs, 
+        metrics: _MetricsView
     ) -> Dict[str, Any]:
         """Assess credit and debt risk"""
         credit_risk = {
@@ -174,30 +517,25 @@ class RiskEvaluationAgent(Agent):
         
         try:
             # Calculate debt-to-asset ratio if data available
-            if 'liabilities' in df.columns and 'assets' in df.columns:
-                latest_debt = df['liabilities'].iloc[-1]
-                latest_assets = df['assets'].iloc[-1]
+            if inputs.latest_assets is not None:
+                inputs.raise_failed('debt_ratio')
+                latest_debt = inputs.latest_debt
+                latest_assets = inputs.latest_assets
                 
                 if latest_assets > 0:
                     debt_ratio = (latest_debt / latest_assets) * 100
-                    credit_risk["debt_to_asset_ratio"] = round(debt_ratio, 2)
+                    credit_risk["debt_to_asset_ratio"] = round(float(debt_ratio), 2)
                     
-                    if debt_ratio < self.risk_thresholds['debt_ratio']['low']:
-                        credit_risk["level"] = "Low"
-                        credit_risk["score"] = 20
-                    elif debt_ratio > self.risk_thresholds['debt_ratio']['high']:
-                        credit_risk["level"] = "High"
-                        credit_risk["score"] = 85
-                    else:
-                        credit_risk["level"] = "Medium"
-                        credit_risk["score"] = 50
+                    credit_risk["level"], credit_risk["score"] = _classify(
+                        debt_ratio, self._debt_ratio_edges, _DEBT_RATIO_BUCKETS
+                    )
                     
                     credit_risk["factors"].append(
                         f"Debt-to-Asset Ratio: {debt_ratio:.2f}%"
                     )
             
             # Check profitability for debt servicing ability
-            profit_margin = metrics.get('profit_margin', 0)
+            profit_margin = metrics.profit_margin
             if profit_margin < 5:
                 credit_risk["factors"].append(
                     "Low profitability may impact debt servicing"
@@ -211,8 +549,8 @@ class RiskEvaluationAgent(Agent):
     
     def _assess_liquidity_risk(
         self, 
-        df: pd.DataFrame, 
-        metrics: Dict[str, Any]
+        inputs: _RiskInputs, 
+        metrics: _MetricsView
     ) -> Dict[str, Any]:
         """Assess liquidity and cash flow risk"""
         liquidity_risk = {
@@ -222,28 +560,25 @@ class RiskEvaluationAgent(Agent):
         }
         
         try:
-            # Calculate current ratio if data available
-            if 'current_assets' in df.columns and 'current_liabilities' in df.columns:
-                current_ratio = (
-                    df['current_assets'].iloc[-1] / df['current_liabilities'].iloc[-1]
-                )
-                liquidity_risk["current_ratio"] = round(current_ratio, 2)
+            # Classify current ratio if data available
+            current_ratio = inputs.current_ratio
+            if current_ratio is not None:
+                inputs.raise_failed('current_ratio')
                 
-                if current_ratio >= self.risk_thresholds['liquidity']['high']:
-                    liquidity_risk["level"] = "Low"
-                    liquidity_risk["score"] = 25
-                elif current_ratio < self.risk_thresholds['liquidity']['low']:
-                    liquidity_risk["level"] = "High"
-                    liquidity_risk["score"] = 80
+                liquidity_risk["current_ratio"] = round(float(current_ratio), 2)
+                
+                liquidity_risk["level"], liquidity_risk["score"] = _classify(
+                    current_ratio, self._liquidity_edges, _LIQUIDITY_BUCKETS
+                )
                 
                 liquidity_risk["factors"].append(
                     f"Current Ratio: {current_ratio:.2f}"
                 )
             
             # Check cash flow trends
-            if 'profit' in df.columns:
-                recent_profits = df['profit'].tail(3)
-                if (recent_profits < 0).any():
+            if inputs.recent_losses is not None:
+                inputs.raise_failed('recent_losses')
+                if inputs.recent_losses:
                     liquidity_risk["factors"].append(
                         "Recent negative cash flows detected"
                     )
@@ -256,8 +591,8 @@ class RiskEvaluationAgent(Agent):
     
     def _assess_operational_risk(
         self, 
-        df: pd.DataFrame, 
-        metrics: Dict[str, Any]
+        inputs: _RiskInputs, 
+        metrics: _MetricsView
     ) -> Dict[str, Any]:
         """Assess operational risk factors"""
         operational_risk = {
@@ -268,9 +603,11 @@ class RiskEvaluationAgent(Agent):
         
         try:
             # Check expense trends
-            if 'expenses' in df.columns:
-                expense_growth = self._calculate_growth_rate(df['expenses'])
-                revenue_growth = metrics.get('revenue_growth', 0)
+            expense_growth = inputs.expense_growth
+            if expense_growth is not None:
+                inputs.raise_failed('expense_growth')
+                
+                revenue_growth = metrics.revenue_growth
                 
                 if expense_growth > revenue_growth + 5:
                     operational_risk["level"] = "Medium"
@@ -282,7 +619,7 @@ class RiskEvaluationAgent(Agent):
                 operational_risk["expense_growth"] = round(expense_growth, 2)
             
             # Check profit margin stability
-            profit_margin = metrics.get('profit_margin', 0)
+            profit_margin = metrics.profit_margin
             if profit_margin < 10:
                 operational_risk["factors"].append(
                     "Low profit margins indicate operational inefficiency"
@@ -294,65 +631,30 @@ class RiskEvaluationAgent(Agent):
         
         return operational_risk
     
-    def _calculate_growth_rate(self, series: pd.Series) -> float:
-        """Calculate growth rate for a series"""
-        if len(series) < 2:
-            return 0.0
-        first_value = series.iloc[0]
-        last_value = series.iloc[-1]
-        if first_value == 0:
-            return 0.0
-        return ((last_value - first_value) / first_value) * 100
-    
     def _calculate_overall_risk(self, risk_factors: Dict[str, Dict]) -> str:
         """Calculate overall risk level from individual risk factors"""
-        total_score = 0
-        count = 0
+        scores = np.array([
+            risk_data['score'] for risk_data in risk_factors.values()
+            if 'score' in risk_data
+        ], dtype=np.float64)
         
-        for risk_type, risk_data in risk_factors.items():
-            if 'score' in risk_data:
-                total_score += risk_data['score']
-                count += 1
-        
-        if count == 0:
+        if scores.size == 0:
             return "Medium"
         
-        avg_score = total_score / count
-        
-        if avg_score < 40:
-            return "Low"
-        elif avg_score < 65:
-            return "Medium"
-        else:
-            return "High"
+        index = np.searchsorted(_OVERALL_RISK_EDGES, scores.mean(), side='right')
+        return _OVERALL_RISK_LEVELS[index]
     
     def _generate_mitigation_strategies(
         self, 
         risk_factors: Dict[str, Dict]
     ) -> List[str]:
         """Generate risk mitigation strategies"""
-        strategies = []
-        
-        for risk_type, risk_data in risk_factors.items():
-            if risk_data.get('level') in ['High', 'Medium']:
-                if risk_type == 'market_risk':
-                    strategies.append(
-                        "Diversify revenue streams to reduce market volatility exposure"
-                    )
-                elif risk_type == 'credit_risk':
-                    strategies.append(
-                        "Implement debt reduction plan and improve credit management"
-                    )
-                elif risk_type == 'liquidity_risk':
-                    strategies.append(
-                        "Increase cash reserves and optimize working capital management"
-                    )
-                elif risk_type == 'operational_risk':
-                    strategies.append(
-                        "Implement cost control measures and improve operational efficiency"
-                    )
-        
-        return strategies
+        return [
+            _MITIGATION_STRATEGIES[risk_type]
+            for risk_type, risk_data in risk_factors.items()
+            if risk_type in _MITIGATION_STRATEGIES
+            and risk_data.get('level') in _MITIGATED_LEVELS
+        ]
     
     def _generate_recommendations(self, evaluation: Dict[str, Any]) -> List[str]:
         """Generate risk-based recommendations"""